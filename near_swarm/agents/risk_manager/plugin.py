@@ -72,11 +72,13 @@ class RiskManagerPlugin(AgentPlugin):
             for trade in proposed_trades
         )
         
+        # Each ratio is computed once and shared by the metrics that need it
+        current_ratio = current_exposure / total_value
         return {
-            'current_exposure_ratio': float(current_exposure / total_value),
+            'current_exposure_ratio': float(current_ratio),
             'proposed_exposure_ratio': float(proposed_exposure / total_value),
             'total_exposure_ratio': float((current_exposure + proposed_exposure) / total_value),
-            'available_risk': float(self.max_total_exposure - (current_exposure / total_value)),
+            'available_risk': float(self.max_total_exposure - current_ratio),
             'max_trade_size': float(total_value * self.max_position_size)
         }
     
@@ -10,6 +10,7 @@ from .create import create
 from .config import config
 from ..plugins import PluginLoader
 from ..core.market_data import MarketDataManager
+from ..core.event_loop import enable_uvloop
 import os
 import yaml
 import time
@@ -17,7 +18,8 @@ import time
 @click.group()
 def cli():
     """NEAR Swarm Intelligence CLI"""
-    pass
+    # Subcommands start their own event loops, so the policy must be set here
+    enable_uvloop()
 
 @cli.command()
 @click.argument('plugin_name')
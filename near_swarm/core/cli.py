@@ -19,6 +19,8 @@ from importlib.util import spec_from_file_location, module_from_spec
 # Import core components
 from near_swarm.core.swarm_agent import SwarmAgent, SwarmConfig
 from near_swarm.core.config import load_config
+from near_swarm.core.llm_cache import LLMCache, DEFAULT_CACHE_PATH
+from near_swarm.core.llm_provider import close_shared_llm_providers
 
 logger = logging.getLogger(__name__)
 
@@ -153,17 +155,32 @@ def list_agents():
         logger.error(f"Error listing agents: {str(e)}")
         sys.exit(1)
 
+async def _run_and_close_providers(strategy) -> None:
+    """Run a strategy coroutine, then close the LLM providers its agents shared."""
+    try:
+        await strategy
+    finally:
+        await close_shared_llm_providers()
+
 @cli.command()
 @click.option('--example', type=str, help='Run an example strategy')
-def run(example: Optional[str] = None):
+@click.option('--cache/--no-cache', 'cache_enabled', default=False,
+              help='Reuse cacheable LLM evaluations from previous runs')
+def run(example: Optional[str] = None, cache_enabled: bool = False):
     """Run a strategy."""
+    disk_cache = None
     try:
+        if cache_enabled:
+            # Evaluations persist across runs so re-running after a small tweak is cheap
+            disk_cache = LLMCache(path=DEFAULT_CACHE_PATH)
+            SwarmAgent.set_llm_cache(disk_cache)
+
         if example:
             if example == 'simple_strategy':
                 click.echo("Running simple strategy example...")
                 try:
                     from near_swarm.examples.simple_strategy import run_simple_strategy
-                    asyncio.run(run_simple_strategy())
+                    asyncio.run(_run_and_close_providers(run_simple_strategy()))
                 except ImportError:
                     click.echo("Error: Simple strategy example not found.")
                     click.echo("Make sure near_swarm package is installed correctly.")
@@ -180,11 +197,14 @@ def run(example: Optional[str] = None):
             strategy_file = os.path.join(strategy_path, 'strategy.py')
             strategy_module = import_strategy(strategy_file)
             
-            asyncio.run(strategy_module.run_strategy())
+            asyncio.run(_run_and_close_providers(strategy_module.run_strategy()))
             
     except Exception as e:
         logger.error(f"Error running strategy: {str(e)}")
         sys.exit(1)
+    finally:
+        if disk_cache is not None:
+            disk_cache.close()
 
 @cli.command()
 def monitor():
@@ -5,10 +5,12 @@ Consensus mechanism for NEAR AI Agents.
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 import asyncio
+import sys
 import time
 
 
-@dataclass
+# Votes pile up in history; slots drop the per-instance __dict__ (3.10+)
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
 class Vote:
     """Vote from an agent."""
     agent_id: str
@@ -0,0 +1,27 @@
+"""
+Event loop setup shared by the CLI, examples and strategy templates.
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+def enable_uvloop() -> bool:
+    """
+    Use uvloop's event loop for RPC-heavy swarms when it is installed.
+
+    Only loops created after this call are affected, so call it before
+    asyncio.run() rather than from inside a coroutine.
+
+    Returns:
+        True if uvloop is now the event loop policy
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop policy")
+    return True
@@ -0,0 +1,140 @@
+"""
+LLM Cache Module
+Caches parsed LLM evaluations so repeated proposals skip the round trip
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Default location for the persistent cache used by the CLI
+DEFAULT_CACHE_PATH = Path("~/.near_swarm/llm_cache.sqlite3")
+
+
+class LLMCache:
+    """In-memory LRU cache of parsed LLM results with a time-to-live.
+
+    With a path, results are also written through to a SQLite file and
+    survive restarts for disk_ttl seconds; memory is checked first, then
+    disk. Lookups are coroutines so disk access runs off the event loop.
+    ``stats`` counts hits and misses for observability.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 30.0,
+        path: Optional[Union[str, Path]] = None,
+        disk_ttl: float = 86400.0
+    ):
+        """Initialize an empty cache."""
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if ttl <= 0 or disk_ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.disk_ttl = disk_ttl
+        # key -> (stored at, result); insertion order doubles as LRU order
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+        self._db: Optional[sqlite3.Connection] = None
+        # One connection shared by the worker threads; sqlite3 needs them serialized
+        self._db_lock = threading.Lock()
+        if path is not None:
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            with self._db_lock, self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS evaluations ("
+                    "key TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL)"
+                )
+
+    @staticmethod
+    def make_key(
+        role: str,
+        model: Optional[str],
+        temperature: Optional[float],
+        proposal_id: str
+    ) -> str:
+        """Build a stable key for one role's evaluation of a proposal."""
+        payload = json.dumps([role, model, temperature, proposal_id], separators=(",", ":"))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a fresh cached result, or None."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return dict(entry[1])
+        if entry is not None:
+            del self._entries[key]
+
+        if self._db is not None:
+            value = await asyncio.get_running_loop().run_in_executor(None, self._disk_get, key)
+            if value is not None:
+                self._remember(key, value)
+                self.stats["hits"] += 1
+                return dict(value)
+
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        self._remember(key, dict(value))
+        if self._db is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._disk_set, key, json.dumps(value)
+            )
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        """Put a result in the in-memory LRU."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a fresh result from SQLite (runs in a worker thread)."""
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT result FROM evaluations WHERE key = ? AND created_at > ?",
+                (key, time.time() - self.disk_ttl)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _disk_set(self, key: str, result: str) -> None:
+        """Write a result to SQLite (runs in a worker thread)."""
+        with self._db_lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO evaluations (key, result, created_at) VALUES (?, ?, ?)",
+                (key, result, time.time())
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        self._entries.clear()
+        self.stats = {"hits": 0, "misses": 0}
+        if self._db is not None:
+            with self._db_lock, self._db:
+                self._db.execute("DELETE FROM evaluations")
+
+    def close(self) -> None:
+        """Close the SQLite file, if any."""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
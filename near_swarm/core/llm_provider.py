@@ -3,20 +3,29 @@ LLM Provider Implementation
 Provides abstract interface and concrete implementations for LLM integration
 """
 
-import os
-from typing import Dict, Any, Optional, List
+import asyncio
+import hashlib
+import importlib.util
+import weakref
+from typing import Dict, Any, Optional, List, Union, AsyncIterator
 from abc import ABC, abstractmethod
 import logging
-import json
 from dataclasses import dataclass
-import openai
-from openai import OpenAI
-import aiohttp
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# HTTP/2 lets concurrent queries share one connection; needs the optional h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 @dataclass
 class LLMConfig:
     """Configuration for LLM providers"""
@@ -45,6 +54,20 @@ class LLMConfig:
         # Normalize provider name
         self.provider = self.provider.lower().strip()
 
+def _response_format(
+    expect_json: bool,
+    response_schema: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Build the OpenAI-style response_format argument, if any."""
+    if response_schema is not None:
+        return {"response_format": {
+            "type": "json_schema",
+            "json_schema": {"name": "response", "schema": response_schema}
+        }}
+    if expect_json:
+        return {"response_format": {"type": "json_object"}}
+    return {}
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
     
@@ -56,9 +79,20 @@ class LLMProvider(ABC):
         self,
         prompt: str,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
-    ) -> str:
-        """Query the LLM with a prompt"""
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        expect_json: bool = False,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Union[str, Dict[str, Any]]:
+        """Query the LLM with a prompt.
+
+        Keep system_prompt identical across calls where possible; providers
+        with prefix caching only bill and compute the changing user prompt.
+        With expect_json the model is constrained to emit a JSON object,
+        which is returned already parsed. A response_schema (JSON Schema)
+        goes further and constrains the object to that shape; it implies
+        expect_json.
+        """
         pass
 
     @abstractmethod
@@ -71,11 +105,39 @@ class LLMProvider(ABC):
         """Query the LLM with multiple prompts"""
         pass
 
+    async def stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        expect_json: bool = False,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Yield the response text as it is generated.
+
+        Closing the iterator early stops generation. Providers without
+        native streaming yield the whole response at once.
+        """
+        yield await self.query(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt
+        )
+
     async def close(self) -> None:
         """Clean up resources."""
-        # OpenAI client doesn't need explicit cleanup
         pass
 
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
 class HyperbolicProvider(LLMProvider):
     """Hyperbolic API provider implementation using OpenAI SDK"""
 
@@ -85,31 +147,81 @@ class HyperbolicProvider(LLMProvider):
         self.config = config
         self.config.validate()
         
-        # Initialize OpenAI client with Hyperbolic configuration
-        self._client = OpenAI(
+        # Async OpenAI client with Hyperbolic configuration; its HTTP
+        # connection pool is kept alive across queries until close()
+        self._client = AsyncOpenAI(
             api_key=config.api_key,
-            base_url=config.api_url
+            base_url=config.api_url,
+            http_client=DefaultAsyncHttpxClient(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=300
+                )
+            )
         )
 
-    async def query(self, prompt: str, temperature: Optional[float] = None, max_tokens: Optional[int] = None) -> str:
+    async def query(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        expect_json: bool = False,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> Union[str, Dict[str, Any]]:
         """Query the LLM provider with a prompt."""
         try:
-            chat_completion = self._client.chat.completions.create(
+            extra = _response_format(expect_json, response_schema)
+            chat_completion = await self._client.chat.completions.create(
                 model=self.config.model,
                 messages=[
-                    {"role": "system", "content": self.config.system_prompt or "You are a helpful AI assistant."},
+                    {"role": "system", "content": system_prompt or self.config.system_prompt or "You are a helpful AI assistant."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=temperature or self.config.temperature,
-                max_tokens=max_tokens or self.config.max_tokens
+                max_tokens=max_tokens or self.config.max_tokens,
+                **extra
             )
             
-            return chat_completion.choices[0].message.content.strip()
+            content = chat_completion.choices[0].message.content.strip()
+            # JSON mode guarantees a well-formed object, so parse it directly
+            return _json_loads(content) if extra else content
 
         except Exception as e:
-            logger.error(f"Error querying Hyperbolic API: {str(e)}")
+            logger.error("Error querying Hyperbolic API: %s", e)
             raise
 
+    async def stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        expect_json: bool = False,
+        response_schema: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Stream the response; closing early cancels the completion upstream."""
+        extra = _response_format(expect_json, response_schema)
+        completion = await self._client.chat.completions.create(
+            model=self.config.model,
+            messages=[
+                {"role": "system", "content": system_prompt or self.config.system_prompt or "You are a helpful AI assistant."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=temperature or self.config.temperature,
+            max_tokens=max_tokens or self.config.max_tokens,
+            stream=True,
+            **extra
+        )
+        try:
+            async for chunk in completion:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await completion.close()
+
     async def batch_query(
         self,
         prompts: List[str],
@@ -118,15 +230,18 @@ class HyperbolicProvider(LLMProvider):
     ) -> List[str]:
         """Query with multiple prompts in parallel."""
         try:
-            results = []
-            for prompt in prompts:
-                result = await self.query(prompt, temperature=temperature, max_tokens=max_tokens)
-                results.append(result)
-            return results
+            return list(await asyncio.gather(*(
+                self.query(prompt, temperature=temperature, max_tokens=max_tokens)
+                for prompt in prompts
+            )))
         except Exception as e:
-            logger.error(f"Error in batch query: {str(e)}")
+            logger.error("Error in batch query: %s", e)
             raise
 
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.close()
+
 def create_llm_provider(config: LLMConfig) -> LLMProvider:
     """Create LLM provider instance based on configuration."""
     config.validate()
@@ -135,3 +250,43 @@ def create_llm_provider(config: LLMConfig) -> LLMProvider:
         return HyperbolicProvider(config)
     raise ValueError(f"Unsupported LLM provider '{provider}'. Currently supported: hyperbolic")
 
+
+
+# Providers shared by agents with identical settings, one set per event loop
+# since the underlying HTTP pools are bound to the loop that opened them
+_SHARED_PROVIDERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, LLMProvider]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_llm_provider(config: LLMConfig) -> LLMProvider:
+    """Get a provider shared by every caller with the same settings.
+
+    Agents pointing at the same endpoint then reuse one connection pool
+    instead of each opening their own. Must be called from a running
+    event loop. Shared providers are closed by close_shared_llm_providers,
+    not by individual callers.
+    """
+    config.validate()
+    key = (
+        config.provider,
+        config.api_url,
+        config.model,
+        config.temperature,
+        config.max_tokens,
+        config.system_prompt,
+        # Digest rather than the key itself, so the secret isn't kept in the cache key
+        hashlib.blake2b(config.api_key.encode(), digest_size=16).hexdigest()
+    )
+    providers = _SHARED_PROVIDERS.setdefault(asyncio.get_running_loop(), {})
+    provider = providers.get(key)
+    if provider is None:
+        provider = providers[key] = create_llm_provider(config)
+    return provider
+
+
+async def close_shared_llm_providers() -> None:
+    """Close the shared providers opened on the running event loop."""
+    providers = _SHARED_PROVIDERS.pop(asyncio.get_running_loop(), {})
+    for provider in providers.values():
+        await provider.close()
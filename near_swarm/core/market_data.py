@@ -7,11 +7,33 @@ import asyncio
 import aiohttp
 import logging
 import time
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List
 from datetime import datetime, timedelta
 
+try:
+    # CoinGecko coin payloads run to hundreds of KB; orjson parses them much faster
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+# Fallback figures when the API gives nothing usable; built once, read-only.
+# Callers get a fresh copy with the current timestamp added.
+_ESTIMATED_NEAR_DATA: Mapping[str, Any] = MappingProxyType({
+    "price": 3.30,  # Estimated NEAR price
+    "volume_24h": 1000000,
+    "market_cap": 3000000000,
+    "price_change_24h": 0.0,
+    "confidence": 50.0  # Lower confidence for estimated data
+})
+_ESTIMATED_DEX_DATA: Mapping[str, Any] = MappingProxyType({
+    "tvl": 1_000_000,  # Default $1M TVL
+    "24h_volume": 100_000,  # Default $100K volume
+    "total_volume": 1_000_000
+})
+
 class MarketDataManager:
     """Manages market data integration with CoinGecko."""
     
@@ -47,11 +69,20 @@ class MarketDataManager:
         self.reset_window = 60.0  # Reset counter every minute
         self.last_reset = time.time()
         self.max_requests_per_minute = 10  # Free API limit
+        # Concurrent fetches take turns so the spacing above still holds;
+        # created on first use so it belongs to the running loop
+        self._rate_lock: Optional[asyncio.Lock] = None
     
     async def _ensure_session(self):
         """Ensure aiohttp session exists."""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            # Keep connections alive and DNS cached between price fetches
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
     
     async def close(self):
         """Close the session."""
@@ -78,29 +109,32 @@ class MarketDataManager:
     
     async def _rate_limit(self):
         """Enhanced rate limiting with exponential backoff."""
-        now = time.time()
-        
-        # Reset counter if window has passed
-        if now - self.last_reset >= self.reset_window:
-            self.request_count = 0
-            self.last_reset = now
-        
-        # Check if we've exceeded rate limit
-        if self.request_count >= self.max_requests_per_minute:
-            delay = self.rate_limit_delay * (2 ** (self.request_count - self.max_requests_per_minute))
-            delay = min(delay, self.max_delay)
-            logger.info(f"Rate limit reached. Waiting {delay:.1f} seconds...")
-            await asyncio.sleep(delay)
-            self.request_count = 0
-            self.last_reset = time.time()
-        
-        # Add delay between requests
-        time_since_last = now - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        
-        self.last_request_time = time.time()
-        self.request_count += 1
+        if self._rate_lock is None:
+            self._rate_lock = asyncio.Lock()
+        async with self._rate_lock:
+            now = time.time()
+            
+            # Reset counter if window has passed
+            if now - self.last_reset >= self.reset_window:
+                self.request_count = 0
+                self.last_reset = now
+            
+            # Check if we've exceeded rate limit
+            if self.request_count >= self.max_requests_per_minute:
+                delay = self.rate_limit_delay * (2 ** (self.request_count - self.max_requests_per_minute))
+                delay = min(delay, self.max_delay)
+                logger.info("Rate limit reached. Waiting %.1f seconds...", delay)
+                await asyncio.sleep(delay)
+                self.request_count = 0
+                self.last_reset = time.time()
+            
+            # Add delay between requests
+            time_since_last = now - self.last_request_time
+            if time_since_last < self.rate_limit_delay:
+                await asyncio.sleep(self.rate_limit_delay - time_since_last)
+            
+            self.last_request_time = time.time()
+            self.request_count += 1
     
     async def get_token_price(self, token: str = "near", retry_count: int = 0) -> Dict[str, Any]:
         """
@@ -131,7 +165,7 @@ class MarketDataManager:
                 f"{self.api_url}/coins/{token_id}"
             ) as response:
                 if response.status == 429:  # Too Many Requests
-                    logger.warning(f"Rate limit hit, using cached data")
+                    logger.warning("Rate limit hit, using cached data")
                     if cache_key in self.cache:
                         return self.cache[cache_key][0]
                     
@@ -148,7 +182,7 @@ class MarketDataManager:
                 if response.status != 200:
                     raise Exception(f"API error: {response.status}")
                 
-                data = await response.json()
+                data = await response.json(loads=_json_loads)
                 if not data or "market_data" not in data:
                     raise Exception(f"No data found for token: {token_id}")
                 
@@ -168,7 +202,7 @@ class MarketDataManager:
                 return result
                 
         except Exception as e:
-            logger.error(f"Error fetching price data: {str(e)}")
+            logger.error("Error fetching price data: %s", e)
             
             # Fallback to cached data if available
             if cache_key in self.cache:
@@ -176,14 +210,7 @@ class MarketDataManager:
                 return self.cache[cache_key][0]
             
             # Return estimated data if no cache available
-            return {
-                "price": 3.30,  # Estimated NEAR price
-                "volume_24h": 1000000,
-                "market_cap": 3000000000,
-                "price_change_24h": 0.0,
-                "last_updated": datetime.now().isoformat(),
-                "confidence": 50.0  # Lower confidence for estimated data
-            }
+            return {**_ESTIMATED_NEAR_DATA, "last_updated": datetime.now().isoformat()}
     
     def _calculate_volatility_from_changes(self, market_data: Dict[str, Any]) -> str:
         """Calculate volatility from price changes."""
@@ -225,35 +252,28 @@ class MarketDataManager:
             async with self.session.get(
                 f"{self.api_url}/exchanges/{dex}"
             ) as response:
+                # One clock read so the result and its cache entry agree
+                now = datetime.now()
                 if response.status != 200:
                     # If DEX not found, return estimated data
-                    result = {
-                        "tvl": 1_000_000,  # Default $1M TVL
-                        "24h_volume": 100_000,  # Default $100K volume
-                        "total_volume": 1_000_000,
-                        "timestamp": datetime.now().isoformat(),
-                    }
+                    result = {**_ESTIMATED_DEX_DATA, "timestamp": now.isoformat()}
                 else:
-                    data = await response.json()
+                    data = await response.json(loads=_json_loads)
+                    volume = float(data.get("trade_volume_24h_btc", 0) * 50000)  # Rough estimate
                     result = {
-                        "tvl": float(data.get("trade_volume_24h_btc", 0) * 50000),  # Rough estimate
-                        "24h_volume": float(data.get("trade_volume_24h_btc", 0) * 50000),
-                        "total_volume": float(data.get("trade_volume_24h_btc", 0) * 50000),
-                        "timestamp": datetime.now().isoformat(),
+                        "tvl": volume,
+                        "24h_volume": volume,
+                        "total_volume": volume,
+                        "timestamp": now.isoformat(),
                     }
                 
-                self.cache[cache_key] = (result, datetime.now())
+                self.cache[cache_key] = (result, now)
                 return result
                 
         except Exception as e:
-            logger.error(f"Error fetching DEX data: {str(e)}")
+            logger.error("Error fetching DEX data: %s", e)
             # Return estimated data on error
-            return {
-                "tvl": 1_000_000,  # Default $1M TVL
-                "24h_volume": 100_000,  # Default $100K volume
-                "total_volume": 1_000_000,
-                "timestamp": datetime.now().isoformat(),
-            }
+            return {**_ESTIMATED_DEX_DATA, "timestamp": datetime.now().isoformat()}
         finally:
             # Don't close the session here as it may be reused
             pass
@@ -279,12 +299,13 @@ class MarketDataManager:
             # Get market data
             [base_token, quote_token] = token_pair.split('/')
             
-            # Get data for both tokens
-            base_data = await self.get_token_price(base_token)
-            quote_data = await self.get_token_price(quote_token)
-            
-            # Get DEX data
-            dex_data = await self.get_dex_data("ref-finance")
+            # Get data for both tokens and the DEX together; cache hits
+            # return at once and misses overlap their responses
+            base_data, quote_data, dex_data = await asyncio.gather(
+                self.get_token_price(base_token),
+                self.get_token_price(quote_token),
+                self.get_dex_data("ref-finance")
+            )
             
             # Calculate metrics
             trade_value = amount * base_data["price"]
@@ -312,7 +333,7 @@ class MarketDataManager:
             }
             
         except Exception as e:
-            logger.error(f"Error analyzing market: {str(e)}")
+            logger.error("Error analyzing market: %s", e)
             raise
         finally:
             # Don't close the session here as it may be reused
@@ -321,11 +342,11 @@ class MarketDataManager:
     async def get_market_context(self) -> Dict[str, Any]:
         """Get comprehensive market context."""
         try:
-            # Get NEAR price and market data
-            near_data = await self.get_token_price("near")
-            
-            # Get DEX data
-            dex_data = await self.get_dex_data("ref-finance")
+            # Get NEAR price and DEX data together
+            near_data, dex_data = await asyncio.gather(
+                self.get_token_price("near"),
+                self.get_dex_data("ref-finance")
+            )
             
             # Calculate market metrics
             volatility = self._calculate_volatility_from_changes(near_data)
@@ -351,7 +372,7 @@ class MarketDataManager:
             }
             
         except Exception as e:
-            logger.error(f"Error getting market context: {str(e)}")
+            logger.error("Error getting market context: %s", e)
             # Return default context on error
             return {
                 "timestamp": datetime.now().isoformat(),
@@ -5,24 +5,42 @@ Using near-api-py to handle transactions more succinctly.
 
 import logging
 import os
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 import asyncio
-import base58
 import re
 
+import httpx
+
+try:
+    # Rust implementation, same bytes-in/bytes-out API as the base58 package
+    from based58 import b58decode
+except ImportError:
+    from base58 import b58decode
+
 try:
-    import near_api
     from near_api.providers import JsonProvider
     from near_api.signer import KeyPair, Signer
     from near_api.account import Account
 except ImportError:
     raise ImportError("Please install near-api-py: pip install near-api-py")
 
-from pydantic import BaseModel, Field, validator
-from aiohttp.client_exceptions import ClientError
+from pydantic import BaseModel, Field, field_validator
 
 logger = logging.getLogger(__name__)
 
+# near-api-py signs with PyNaCl (libsodium, releases the GIL) but submits with
+# blocking `requests` calls, so transactions run on a shared worker pool to keep
+# the event loop free while several swarm agents send concurrently.
+_TX_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) + 4),
+    thread_name_prefix="near-tx"
+)
+
+# HTTP/2 lets concurrent view calls share one connection; httpx needs `h2` for it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 class NEARError(Exception):
     pass
 
@@ -35,6 +53,32 @@ class NEARRPCError(NEARError):
 class InvalidKeyError(NEARError):
     pass
 
+# Optional quotes/whitespace around 'ed25519:<base58 secret>'
+_KEY_RE = re.compile(r"""^\s*['"]?ed25519:([1-9A-HJ-NP-Za-km-z]{43,88})['"]?\s*$""")
+
+def _normalize_private_key(value: str) -> str:
+    """Validate a private key and return it as 'ed25519:base58string'."""
+    match = _KEY_RE.match(value)
+    if not match:
+        if 'ed25519:' not in value:
+            raise InvalidKeyError(
+                "Private key must start with 'ed25519:'. "
+                "Format: ed25519:base58string"
+            )
+        raise InvalidKeyError(
+            "Invalid base58 encoding in private key.\n"
+            "Please ensure your private key is in the correct format: ed25519:base58string"
+        )
+
+    # The alphabet is already checked; decode once to check the key length
+    if len(b58decode(match.group(1).encode('ascii'))) < 32:
+        raise InvalidKeyError(
+            "Private key is too short to be an ed25519 key.\n"
+            "Please ensure your private key is in the correct format: ed25519:base58string"
+        )
+
+    return f"ed25519:{match.group(1)}"
+
 class NEARConfig(BaseModel):
     """NEAR connection configuration."""
     network: str = Field(..., description="Network to connect to (testnet/mainnet)")
@@ -43,31 +87,11 @@ class NEARConfig(BaseModel):
     node_url: Optional[str] = Field(None, description="Custom RPC endpoint")
     use_backup: bool = Field(False, description="Use backup RPC endpoints")
 
-    @validator('private_key')
+    @field_validator('private_key')
+    @classmethod
     def validate_private_key(cls, v):
         """Validate and clean private key format."""
-        # Strip quotes and whitespace
-        key = v.strip().strip("'").strip('"')
-        
-        # Validate ed25519 prefix
-        if not key.startswith('ed25519:'):
-            raise InvalidKeyError(
-                "Private key must start with 'ed25519:'. "
-                "Format: ed25519:base58string"
-            )
-        
-        # Extract and validate base58 portion
-        try:
-            base58_part = key.split('ed25519:')[1]
-            # Attempt base58 decode to validate format
-            base58.b58decode(base58_part)
-        except Exception as e:
-            raise InvalidKeyError(
-                f"Invalid base58 encoding in private key. Error: {str(e)}\n"
-                "Please ensure your private key is in the correct format: ed25519:base58string"
-            )
-        
-        return key
+        return _normalize_private_key(v)
 
 class NEARConnection:
     """
@@ -102,25 +126,7 @@ class NEARConnection:
         
         # Clean and validate private key
         try:
-            # Strip quotes and whitespace
-            self.private_key = private_key.strip().strip("'").strip('"')
-            
-            # Validate ed25519 prefix
-            if not self.private_key.startswith('ed25519:'):
-                raise InvalidKeyError(
-                    "Private key must start with 'ed25519:'. "
-                    "Format: ed25519:base58string"
-                )
-            
-            # Validate base58 portion
-            base58_part = self.private_key.split('ed25519:')[1]
-            try:
-                base58.b58decode(base58_part)
-            except Exception as e:
-                raise InvalidKeyError(
-                    f"Invalid base58 encoding in private key. Error: {str(e)}\n"
-                    "Please ensure your private key is in the correct format: ed25519:base58string"
-                )
+            self.private_key = _normalize_private_key(private_key)
         except InvalidKeyError as e:
             logger.error(f"Invalid private key format: {str(e)}")
             raise
@@ -130,6 +136,14 @@ class NEARConnection:
 
         self.node_url = node_url or "https://rpc.testnet.fastnear.com"
         self.use_backup = use_backup
+        # Constant per connection; send_transaction only appends the hash
+        self._explorer_prefix = f"https://{self.network}.nearblocks.io/txns/"
+
+        # Serializes sends from this account so access-key nonces stay ordered
+        self._send_lock = asyncio.Lock()
+
+        # Async JSON-RPC client for view calls, created on first use
+        self._client: Optional[httpx.AsyncClient] = None
 
         try:
             # Create the NEAR JSON-RPC provider
@@ -157,10 +171,39 @@ class NEARConnection:
         """Async context manager exit."""
         await self.close()
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the shared JSON-RPC client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=30.0
+            )
+        return self._client
+
+    async def _rpc_call(self, method: str, params: Any) -> Dict[str, Any]:
+        """Make a JSON-RPC call to the node without blocking the event loop."""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": "dontcare",
+            "method": method,
+            "params": params
+        }
+        try:
+            response = await self._get_client().post(self.node_url, json=payload)
+            response.raise_for_status()
+            content = response.json()
+        except httpx.HTTPError as e:
+            raise NEARRPCError(f"RPC request failed: {str(e)}")
+
+        if "error" in content:
+            raise NEARRPCError(str(content["error"]))
+        return content["result"]
+
     async def check_account(self, account_id: str) -> bool:
         """Check if account exists."""
         try:
-            query_response = self.provider.query({
+            query_response = await self._rpc_call("query", {
                 "request_type": "view_account",
                 "finality": "final",
                 "account_id": account_id
@@ -173,7 +216,7 @@ class NEARConnection:
     async def get_account_balance(self) -> Dict[str, str]:
         """Get account balance for self.account_id."""
         try:
-            query_response = self.provider.query({
+            query_response = await self._rpc_call("query", {
                 "request_type": "view_account",
                 "finality": "final",
                 "account_id": self.account_id
@@ -196,24 +239,39 @@ class NEARConnection:
         """
         max_retries = 3
         base_delay = 1  # seconds
+        # Convert NEAR float to yoctoNEAR as an integer
+        amount_yocto = int(amount * 1e24)
         
         for attempt in range(max_retries):
             try:
-                # Convert NEAR float to yoctoNEAR as an integer
-                amount_yocto = int(amount * 1e24)
-                
                 logger.info(f"Attempting transaction (try {attempt + 1}/{max_retries})")
                 logger.info(f"Sending {amount} NEAR to {receiver_id}")
 
-                # Use near-api-py's send_money with automatic nonce handling
-                outcome = self.account.send_money(receiver_id, amount_yocto)
+                # Use near-api-py's send_money with automatic nonce handling,
+                # off the event loop so other agents keep making progress
+                loop = asyncio.get_running_loop()
+                await self._send_lock.acquire()
+                try:
+                    send = loop.run_in_executor(
+                        _TX_EXECUTOR,
+                        self.account.send_money,
+                        receiver_id,
+                        amount_yocto
+                    )
+                except BaseException:
+                    self._send_lock.release()
+                    raise
+                # The worker thread can't be stopped, so the lock is held until
+                # it finishes even if this caller is cancelled meanwhile
+                send.add_done_callback(lambda _: self._send_lock.release())
+                outcome = await asyncio.shield(send)
                 
                 # Extract transaction details
                 tx_hash = outcome.get("transaction_outcome", {}).get("id", None)
                 if not tx_hash:
                     raise NEARRPCError("No transaction hash returned from send_money")
 
-                explorer_url = f"https://{self.network}.nearblocks.io/txns/{tx_hash}"
+                explorer_url = self._explorer_prefix + tx_hash
                 
                 logger.info(f"Transaction successful! Hash: {tx_hash}")
                 logger.info(f"Explorer URL: {explorer_url}")
@@ -245,10 +303,12 @@ class NEARConnection:
 
     async def close(self):
         """
-        near-api-py doesn't keep an open HTTP session by default,
-        so this is a no-op.
+        Close the JSON-RPC client. near-api-py doesn't keep an open
+        HTTP session, so transactions need no cleanup.
         """
-        pass
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
 
 async def create_near_connection(config: NEARConfig) -> "NEARConnection":
     """
@@ -1,9 +1,13 @@
 """Base strategy class for NEAR Swarm Intelligence."""
 import abc
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, List, Callable, Awaitable
 
 from near_swarm.core.swarm_agent import SwarmAgent
 
+# Most agent calls run_all makes at once
+_MAX_PARALLEL = 32
+
 class Strategy(abc.ABC):
     """Abstract base class for swarm strategies."""
 
@@ -11,6 +15,31 @@ class Strategy(abc.ABC):
         """Initialize the strategy with a list of agents."""
         self.agents = agents
 
+    async def run_all(self, fn: Callable[[SwarmAgent], Awaitable[Any]]) -> List[Any]:
+        """Run fn for every agent concurrently.
+
+        Use this from execute() instead of awaiting agents one by one in a
+        for loop, so wall time is the slowest agent rather than the sum.
+
+        Args:
+            fn: Coroutine function taking an agent
+
+        Returns:
+            List[Any]: Results in agent order; failures are returned as
+                exception instances rather than raised
+        """
+        # Cap on concurrent agent calls; agents may be added after __init__
+        sem = asyncio.Semaphore(max(1, min(len(self.agents), _MAX_PARALLEL)))
+
+        async def _one(agent: SwarmAgent) -> Any:
+            async with sem:
+                return await fn(agent)
+
+        return await asyncio.gather(
+            *[_one(agent) for agent in self.agents],
+            return_exceptions=True
+        )
+
     @abc.abstractmethod
     async def start(self):
         """Start the strategy."""
@@ -31,4 +60,4 @@ class Strategy(abc.ABC):
                 - confidence (float): Confidence level in the decision (0.0 to 1.0)
                 - reasoning (str): Explanation of the decision
         """
-        pass 
\ No newline at end of file
+        pass
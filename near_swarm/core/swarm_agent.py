@@ -3,27 +3,232 @@ Swarm Agent Module
 Implements swarm intelligence for NEAR agents with LLM-powered decision making
 """
 
+import asyncio
+import hashlib
 import logging
 import json
+import re
+import sys
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple, Union
 
-from near_swarm.core.agent import SwarmAgent, AgentConfig
-from near_swarm.core.llm_provider import LLMProvider, create_llm_provider, LLMConfig
+from near_swarm.core.llm_cache import LLMCache
+from near_swarm.core.llm_provider import get_shared_llm_provider, LLMConfig, LLMProvider
 from near_swarm.plugins.base import AgentPlugin
 
+def _json_default(obj: Any) -> Any:
+    """Serialize read-only proposal views as plain objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+try:
+    # Rust JSON codec; its decode error subclasses json.JSONDecodeError
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson stops at 64-bit ints; yoctoNEAR amounts are far larger
+            return json.dumps(obj, default=_json_default)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=_json_default)
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 logger = logging.getLogger(__name__)
 
+# Parsed LLM evaluations are reused for identical proposals within this window
+_EVAL_CACHE_TTL = 30.0
+_EVAL_CACHE_MAX_SIZE = 1024
+
+
+def _proposal_digest(proposal: Mapping[str, Any]) -> str:
+    """Stable digest of a proposal, identical across processes and peers."""
+    canonical = json.dumps(proposal, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+class _SharedProposal(Mapping):
+    """Read-only proposal view built by propose_action for its peers.
+
+    Carries the digest and rendered prompt computed from the proposal's
+    content. Only this type is trusted for them; an "id" on any other
+    proposal dict is caller-supplied and says nothing about the content.
+    """
+
+    __slots__ = ("_data", "digest", "prompt_text")
+
+    def __init__(self, data: Mapping[str, Any], digest: str, prompt_text: str):
+        self._data = MappingProxyType(dict(data))
+        self.digest = digest
+        self.prompt_text = prompt_text
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Matches the exact flat object the prompt asks for, with an escape-free
+# reasoning string; anything else goes through the full JSON parser
+_FAST_VOTE_RE = re.compile(
+    r'\s*\{\s*"decision"\s*:\s*"(approve|reject|abstain)"\s*,'
+    r'\s*"confidence"\s*:\s*(0(?:\.\d+)?|1(?:\.0+)?)\s*,'
+    r'\s*"reasoning"\s*:\s*"([^"\\]*)"\s*\}\s*'
+)
+
+# Streaming counterpart: the vote header is complete once the opening quote of
+# the reasoning has arrived; the reasoning itself can then be cut short
+_STREAM_VOTE_HEAD_RE = re.compile(
+    r'\s*\{\s*"decision"\s*:\s*"(approve|reject|abstain)"\s*,'
+    r'\s*"confidence"\s*:\s*(0(?:\.\d+)?|1(?:\.0+)?)\s*,'
+    r'\s*"reasoning"\s*:\s*"'
+)
+_JSON_STRING_BODY_RE = re.compile(r'(?:[^"\\]|\\.)*')
+
+# Vote schema compiled once into a plain Python function when fastjsonschema
+# is installed; its errors subclass ValueError like the manual checks
+_VOTE_SCHEMA = {
+    "type": "object",
+    "required": ["decision", "confidence", "reasoning"],
+    "properties": {
+        "decision": {"enum": ["approve", "reject", "abstain"]},
+        "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+        "reasoning": {"type": "string"}
+    }
+}
+_validate_vote = fastjsonschema.compile(_VOTE_SCHEMA) if fastjsonschema is not None else None
+
+# Shape of a combined response covering several roles or proposals
+_EVALUATIONS_SCHEMA = {
+    "type": "object",
+    "required": ["evaluations"],
+    "properties": {"evaluations": {"type": "array", "items": _VOTE_SCHEMA}}
+}
+
+# Fixed votes for agents that can't evaluate; callers get dict copies
+_NOT_RUNNING_VOTE: Mapping[str, Any] = MappingProxyType(
+    {"decision": "reject", "confidence": 0.0, "reasoning": "Agent is not running"}
+)
+_NO_LLM_VOTE: Mapping[str, Any] = MappingProxyType(
+    {"decision": "reject", "confidence": 0.0, "reasoning": "No LLM configured for evaluation"}
+)
+_TIMEOUT_VOTE: Mapping[str, Any] = MappingProxyType(
+    {"decision": "reject", "confidence": 0.0, "reasoning": "No vote before timeout"}
+)
+
+# Prompt shells. The system part depends only on the role(s), so providers
+# can reuse it as a cached prefix; the user part carries just the proposal.
+_EVAL_SYSTEM_TEMPLATE = """{role_prompt}
+
+Provide your analysis and decision in JSON format with:
+- decision: string (approve/reject/abstain)
+- confidence: float (0-1)
+- reasoning: string
+"""
+
+_BATCH_EVAL_SYSTEM_TEMPLATE = """Evaluate the proposal from each of the following {count} perspectives.
+
+{perspectives}
+
+Respond with a JSON object whose "evaluations" array holds one object per
+perspective, in order, each with:
+- decision: string (approve/reject/abstain)
+- confidence: float (0-1)
+- reasoning: string
+"""
+
+_MULTI_PROPOSAL_SYSTEM_TEMPLATE = """{role_prompt}
+
+You will receive {count} numbered proposals. Evaluate each one independently.
+
+Respond with a JSON object whose "evaluations" array holds one object per
+proposal, in order, each with:
+- decision: string (approve/reject/abstain)
+- confidence: float (0-1)
+- reasoning: string
+"""
+
+_PROPOSAL_TEMPLATE = """Proposal to Evaluate:
+Type: {ptype}
+Parameters: {params}
+Proposer: {proposer}
+"""
+
+
+def _fail_pending(batch: List[tuple], error: Optional[Exception] = None) -> None:
+    """Settle the unanswered futures of queued (prompt, future) pairs."""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(error or RuntimeError("Agent was cleaned up before evaluating"))
+
+
+@lru_cache(maxsize=64)
+def _eval_system_prompt(role_prompt: str) -> str:
+    """Build the system prompt for a role once and reuse it."""
+    return _EVAL_SYSTEM_TEMPLATE.format(role_prompt=role_prompt)
+
+
+def _format_proposal(proposal: Mapping[str, Any]) -> str:
+    """Render the per-call part of an evaluation prompt."""
+    # propose_action renders it once for all peers
+    if isinstance(proposal, _SharedProposal):
+        return proposal.prompt_text
+    return _PROPOSAL_TEMPLATE.format(
+        ptype=proposal.get('type'),
+        params=_dumps(proposal.get('params', {})),
+        proposer=proposal.get('proposer')
+    )
+
+
+# Evaluation prompts for the built-in roles, loaded once at import
+ROLE_PROMPTS: Dict[str, str] = json.loads(
+    Path(__file__).with_name("role_prompts.json").read_text(encoding="utf-8")
+)
 
-@dataclass
+
+# slots= needs Python 3.10; older interpreters still get a frozen dataclass
+_DATACLASS_OPTS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+
+@dataclass(**_DATACLASS_OPTS)
 class SwarmConfig:
-    """Swarm agent configuration."""
+    """Swarm agent configuration. Immutable; use dataclasses.replace to derive variants."""
     role: str
     min_confidence: float = 0.7
     min_votes: int = 2
-    timeout: float = 1.0
+    timeout: float = 30.0  # Seconds to wait for peer votes; LLM round trips take several
     max_retries: int = 3
     llm: Optional[LLMConfig] = None
+    max_reasoning_chars: Optional[int] = None  # Truncate peer reasoning kept in results
+    dedupe_identical_peers: bool = False  # One evaluation per group of identically configured peers
+    batch_roles: bool = False  # One combined query for peers sharing an LLM provider
+    batch_window: Optional[float] = None  # Seconds to coalesce concurrent evaluations
+    max_batch_size: int = 8
+    # Static rules checked before any LLM call; proposals failing them are rejected outright
+    max_amount: Optional[float] = None
+    allowed_actions: Optional[Tuple[str, ...]] = None
+    # Reuse cached evaluations of identical proposals. None caches only
+    # deterministic (temperature 0) votes; True also caches sampled ones
+    cache_enabled: Optional[bool] = None
 
     def __post_init__(self):
         """Validate configuration."""
@@ -35,19 +240,54 @@ class SwarmConfig:
             raise ValueError("min_votes must be at least 1")
         if self.timeout <= 0:
             raise ValueError("timeout must be positive")
+        if self.max_reasoning_chars is not None and self.max_reasoning_chars < 1:
+            raise ValueError("max_reasoning_chars must be positive")
+        if self.batch_window is not None and self.batch_window <= 0:
+            raise ValueError("batch_window must be positive")
+        if self.max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if self.max_amount is not None and self.max_amount < 0:
+            raise ValueError("max_amount must not be negative")
 
 
 class SwarmAgent(AgentPlugin):
     """Swarm agent with plugin support and LLM-powered decision making."""
 
-    def __init__(self, config: SwarmConfig):
-        """Initialize swarm agent."""
+    # Parsed LLM evaluations shared by every agent in the process;
+    # see set_llm_cache to persist them or turn caching off
+    _llm_cache: Optional[LLMCache] = LLMCache(max_size=_EVAL_CACHE_MAX_SIZE, ttl=_EVAL_CACHE_TTL)
+
+    def __init__(self, config: SwarmConfig, llm_provider: Optional[LLMProvider] = None):
+        """Initialize swarm agent.
+
+        Pass llm_provider to share one provider between several agents;
+        its lifetime then stays with the caller.
+        """
         self.config = config
-        self.llm = None
+        self.llm = llm_provider
         self.swarm_peers: List['SwarmAgent'] = []
+        # id() of each peer, so membership checks don't scan swarm_peers
+        self._peer_ids: set = set()
+        # The config is frozen, so the role prompt can be resolved once
+        self._role_prompt = ROLE_PROMPTS.get(
+            config.role,
+            f"As a {config.role}, evaluate this proposal based on your expertise."
+        )
+        self._system_prompt = _eval_system_prompt(self._role_prompt)
+        # Micro-batching of concurrent evaluations (config.batch_window)
+        self._inbox: Optional[asyncio.Queue] = None
+        self._batch_worker: Optional[asyncio.Task] = None
+        self._batch_tasks: set = set()
+        # Cache key -> future of the LLM call currently evaluating it
+        self._inflight: Dict[str, asyncio.Future] = {}
         self._initialized = False
         self._is_running = False
-        logger.info(f"Initialized swarm agent with role: {config.role}")
+        logger.info("Initialized swarm agent with role: %s", config.role)
+
+    @classmethod
+    def set_llm_cache(cls, cache: Optional[LLMCache]) -> None:
+        """Replace the process-wide evaluation cache; None disables caching."""
+        cls._llm_cache = cache
 
     async def initialize(self) -> None:
         """Initialize agent resources."""
@@ -55,25 +295,32 @@ class SwarmAgent(AgentPlugin):
             return
 
         try:
-            # Initialize LLM if configured
-            if self.config.llm:
-                self.llm = create_llm_provider(self.config.llm)
+            # Agents with the same LLM settings share one provider and pool
+            if self.llm is None and self.config.llm:
+                self.llm = get_shared_llm_provider(self.config.llm)
 
             self._initialized = True
             self._is_running = True
-            logger.info(f"Initialized SwarmAgent with role: {self.config.role}")
+            logger.info("Initialized SwarmAgent with role: %s", self.config.role)
 
         except Exception as e:
-            logger.error(f"Error initializing SwarmAgent: {str(e)}")
+            logger.error("Error initializing SwarmAgent: %s", e)
             raise
 
+    def _add_peer(self, peer: 'SwarmAgent') -> None:
+        """Add a peer unless it is already known."""
+        if id(peer) not in self._peer_ids:
+            self._peer_ids.add(id(peer))
+            self.swarm_peers.append(peer)
+
     async def join_swarm(self, peers: List['SwarmAgent']):
         """Join a swarm of agents."""
-        self.swarm_peers = peers
         for peer in peers:
-            if self not in peer.swarm_peers:
-                peer.swarm_peers.append(self)
-        logger.info(f"Joined swarm with {len(peers)} peers")
+            if peer is self:
+                continue
+            self._add_peer(peer)
+            peer._add_peer(self)
+        logger.info("Joined swarm with %d peers", len(peers))
 
     async def propose_action(self, action_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Propose an action to the swarm."""
@@ -85,16 +332,22 @@ class SwarmAgent(AgentPlugin):
             "params": params,
             "proposer": self.config.role
         }
+        proposal_id = _proposal_digest(proposal)
+
+        # Every peer shares one read-only view; the id and rendered prompt
+        # save each of them from re-serializing the proposal
+        shared_proposal = _SharedProposal({
+            **proposal,
+            "params": MappingProxyType(dict(params)),
+            "id": proposal_id
+        }, proposal_id, _format_proposal(proposal))
 
-        # Collect votes from peers
-        votes = []
-        for peer in self.swarm_peers:
-            vote = await peer.evaluate_proposal(proposal)
-            votes.append(vote)
+        # Collect votes concurrently, stopping as soon as the outcome is decided
+        expected_votes = len(self.swarm_peers)
+        votes, positive_votes = await self._collect_votes(shared_proposal)
 
         # Calculate consensus
         total_votes = len(votes)
-        positive_votes = sum(1 for v in votes if v["decision"] == "approve")
         approval_rate = positive_votes / total_votes if total_votes > 0 else 0
 
         # Check if consensus is reached
@@ -104,20 +357,195 @@ class SwarmAgent(AgentPlugin):
         )
 
         result = {
+            "proposal_id": proposal_id,
             "consensus": consensus,
             "approval_rate": approval_rate,
             "total_votes": total_votes,
+            # Consensus became unreachable and the remaining evaluations were cancelled
+            "early_abort": not consensus and total_votes < expected_votes,
             "votes": votes,
             "reasons": [v["reasoning"] for v in votes]
         }
 
-        logger.info(f"Proposal result: consensus={consensus}, approval_rate={approval_rate}")
+        logger.info("Proposal result: consensus=%s, approval_rate=%s", consensus, approval_rate)
         return result
 
-    async def evaluate_proposal(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    async def _collect_votes(self, proposal: Mapping[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        """Gather peer votes in completion order with early exit.
+
+        Returns the votes together with the number of approvals among them.
+
+        Stops once consensus is guaranteed (enough approvals even if every
+        remaining peer rejects) or impossible (too few peers left to reach
+        min_votes or min_confidence), and cancels the outstanding requests.
+        Peers still pending after config.timeout are cancelled and recorded
+        as rejections.
+        """
+        peers = self.swarm_peers
+        # id(representative) -> number of peers its vote stands for
+        copies: Dict[int, int] = {}
+        if self.config.dedupe_identical_peers:
+            # Only peers that would cast the same vote share one: same class,
+            # provider, state and an equal config (rules, thresholds, LLM settings)
+            representatives: List['SwarmAgent'] = []
+            for peer in peers:
+                rep = next((
+                    r for r in representatives
+                    if type(r) is type(peer) and r.llm is peer.llm and
+                    r._is_running == peer._is_running and r.config == peer.config
+                ), None)
+                if rep is None:
+                    rep = peer
+                    representatives.append(peer)
+                copies[id(rep)] = copies.get(id(rep), 0) + 1
+            peers = representatives
+
+        tasks = []
+
+        def schedule(coro, group: List['SwarmAgent']) -> None:
+            if copies:
+                coro = self._fan_out(coro, [copies[id(p)] for p in group])
+            tasks.append(asyncio.create_task(coro))
+
+        # Peers sharing one LLM provider can be evaluated with a single query
+        groups: Dict[int, List['SwarmAgent']] = {}
+        for peer in peers:
+            if self.config.batch_roles and peer.llm is not None and peer._is_running:
+                groups.setdefault(id(peer.llm), []).append(peer)
+            else:
+                schedule(self._vote_or_reject(peer, proposal), [peer])
+        for group in groups.values():
+            if len(group) > 1:
+                schedule(type(self).batch_evaluate(group, proposal), group)
+            else:
+                schedule(self._vote_or_reject(group[0], proposal), group)
+
+        total = len(self.swarm_peers)
+        min_votes = self.config.min_votes
+        min_confidence = self.config.min_confidence
+        max_reasoning = self.config.max_reasoning_chars
+        votes: List[Dict[str, Any]] = []
+        positive = 0
+
+        try:
+            for next_votes in asyncio.as_completed(tasks, timeout=self.config.timeout):
+                for vote in await next_votes:
+                    if max_reasoning is not None and len(vote.get("reasoning", "")) > max_reasoning:
+                        vote = {**vote, "reasoning": vote["reasoning"][:max_reasoning]}
+                    votes.append(vote)
+                    if vote.get("decision") == "approve":
+                        positive += 1
+
+                remaining = total - len(votes)
+                if positive >= min_votes and positive / total >= min_confidence:
+                    break
+                if (positive + remaining < min_votes or
+                        (positive + remaining) / total < min_confidence):
+                    break
+        except asyncio.TimeoutError:
+            # Peers that missed the deadline count against the proposal
+            logger.warning("Vote collection timed out with %d/%d votes", len(votes), total)
+            votes.extend(dict(_TIMEOUT_VOTE) for _ in range(total - len(votes)))
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        return votes, positive
+
+    @staticmethod
+    async def _fan_out(votes_coro, copies: List[int]) -> List[Dict[str, Any]]:
+        """Repeat each representative's vote for the peers it stands for."""
+        votes = await votes_coro
+        return [vote for vote, n in zip(votes, copies) for _ in range(n)]
+
+    @staticmethod
+    async def _vote_or_reject(peer: 'SwarmAgent', proposal: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        """Get one peer's vote, turning a failure into a rejection."""
+        try:
+            return [await peer.evaluate_proposal(proposal)]
+        except Exception as e:
+            return [{
+                "decision": "reject",
+                "confidence": 0.0,
+                "reasoning": f"Evaluation failed: {str(e)}"
+            }]
+
+    @classmethod
+    async def batch_evaluate(
+        cls,
+        agents: List['SwarmAgent'],
+        proposal: Mapping[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Evaluate a proposal for agents sharing one LLM provider.
+
+        Static rules are checked first and agents with a cached evaluation
+        use it; the role perspectives of the rest go into one prompt and the LLM returns one evaluation per role,
+        replacing N round trips with one. Falls back to evaluating each
+        agent separately if the combined response is unusable.
+        """
+        votes: List[Optional[Dict[str, Any]]] = [None] * len(agents)
+        # (position, agent, cache key, cache) of each agent still needing the LLM
+        misses = []
+        for i, agent in enumerate(agents):
+            rejection = agent._cheap_reject(proposal)
+            if rejection is not None:
+                votes[i] = rejection
+                continue
+            cache = agent._eval_cache()
+            key = agent._cache_key(proposal) if cache is not None else None
+            cached = await cache.get(key) if cache is not None else None
+            if cached is not None:
+                votes[i] = agent._apply_min_confidence(cached)
+            else:
+                misses.append((i, agent, key, cache))
+
+        if len(misses) == 1:
+            i, agent, _, _ = misses[0]
+            votes[i] = (await cls._vote_or_reject(agent, proposal))[0]
+        elif misses:
+            pending = [agent for _, agent, _, _ in misses]
+            try:
+                system_prompt, prompt = cls._format_batch_prompt(pending, proposal)
+                response = await pending[0].llm.query(
+                    prompt,
+                    system_prompt=system_prompt,
+                    expect_json=True,
+                    response_schema=_EVALUATIONS_SCHEMA
+                )
+                if isinstance(response, str):
+                    response = _loads(response)
+                results = response.get("evaluations") if isinstance(response, dict) else None
+                if not isinstance(results, list) or len(results) != len(pending):
+                    raise ValueError("Expected one evaluation per role")
+
+                for (i, agent, key, cache), result in zip(misses, results):
+                    agent._validate_result(result)
+                    if cache is not None:
+                        await cache.set(key, result)
+                    votes[i] = agent._apply_min_confidence(result)
+
+            except Exception as e:
+                logger.warning("Batched evaluation failed, evaluating individually: %s", e)
+                results = await asyncio.gather(
+                    *(cls._vote_or_reject(agent, proposal) for agent in pending)
+                )
+                for (i, _, _, _), agent_votes in zip(misses, results):
+                    votes[i] = agent_votes[0]
+
+        return votes
+
+    async def evaluate_proposal(self, proposal: Mapping[str, Any]) -> Dict[str, Any]:
         """Evaluate a proposal using role-specific expertise."""
         if not self._is_running:
-            return {"decision": "reject", "confidence": 0.0, "reasoning": "Agent is not running"}
+            return dict(_NOT_RUNNING_VOTE)
+        if self._initialized and self.llm is None:
+            return dict(_NO_LLM_VOTE)
+
+        rejection = self._cheap_reject(proposal)
+        if rejection is not None:
+            logger.info("Rejected without LLM evaluation: %s", rejection["reasoning"])
+            return rejection
 
         try:
             # Get role-specific evaluation prompt
@@ -144,43 +572,41 @@ class SwarmAgent(AgentPlugin):
             return result
 
         except Exception as e:
-            logger.error(f"Error evaluating proposal: {str(e)}")
+            logger.error("Error evaluating proposal: %s", e)
             return {
                 "decision": "reject",
                 "confidence": 0.0,
                 "reasoning": f"Evaluation failed: {str(e)}"
             }
 
-    def _get_role_prompt(self) -> str:
-        """Get role-specific evaluation prompt."""
-        if self.config.role == "risk_manager":
-            return """As a Risk Manager, evaluate this proposal focusing on:
-1. Position Size Analysis
-2. Security Assessment
-3. Risk Metrics
-4. Compliance and Limits
-
-Your primary responsibility is protecting assets and maintaining risk parameters."""
-
-        elif self.config.role == "market_analyzer":
-            return """As a Market Analyzer, evaluate this proposal focusing on:
-1. Price Analysis
-2. Market Conditions
-3. Technical Indicators
-4. Cross-market Analysis
-
-Your primary responsibility is market analysis and trend identification."""
-
-        elif self.config.role == "strategy_optimizer":
-            return """As a Strategy Optimizer, evaluate this proposal focusing on:
-1. Execution Optimization
-2. Cost Analysis
-3. Performance Metrics
-4. Technical Efficiency
+    def _cheap_reject(self, proposal: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """Reject proposals that break the configured static rules."""
+        config = self.config
+        allowed = config.allowed_actions
+        if allowed is not None and proposal.get("type") not in allowed:
+            return {
+                "decision": "reject",
+                "confidence": 1.0,
+                "reasoning": f"Action type '{proposal.get('type')}' is not allowed"
+            }
 
-Your primary responsibility is optimizing execution and performance."""
+        max_amount = config.max_amount
+        if max_amount is not None:
+            try:
+                amount = float(proposal.get("params", {}).get("amount"))
+            except (TypeError, ValueError):
+                return None
+            if amount > max_amount:
+                return {
+                    "decision": "reject",
+                    "confidence": 1.0,
+                    "reasoning": f"Amount {amount} exceeds limit {max_amount}"
+                }
+        return None
 
-        return f"As a {self.config.role}, evaluate this proposal based on your expertise."
+    def _get_role_prompt(self) -> str:
+        """Get role-specific evaluation prompt."""
+        return self._role_prompt
 
     async def evaluate(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate using LLM and return decision."""
@@ -188,71 +614,315 @@ Your primary responsibility is optimizing execution and performance."""
             await self.initialize()
 
         try:
-            # Format context for LLM
-            prompt = self._format_prompt(context)
+            cache_key = self._cache_key(context.get("proposal", {}))
+            cache = self._eval_cache()
+            result = await cache.get(cache_key) if cache is not None else None
+            while result is None:
+                pending = self._inflight.get(cache_key)
+                if pending is None:
+                    result = await self._query_once(cache_key, context, cache)
+                    break
+                # An identical evaluation is already running; share its result
+                try:
+                    result = dict(await asyncio.shield(pending))
+                except asyncio.CancelledError:
+                    if not pending.cancelled():
+                        raise
+                    # The first caller was cancelled; the next one queries
+
+            return self._apply_min_confidence(result)
 
-            # Get LLM response
-            response = await self.llm.query(prompt)
+        except Exception as e:
+            logger.error("Error in evaluation: %s", e)
+            return {"error": str(e)}
 
-            # Parse and validate response
-            result = self._parse_response(response)
+    def _eval_cache(self) -> Optional[LLMCache]:
+        """The evaluation cache this agent uses, or None when caching is off."""
+        enabled = self.config.cache_enabled
+        if enabled is None:
+            # A sampled vote is one draw, not the answer; don't replay it
+            llm_config = self._llm_config()
+            enabled = llm_config is not None and llm_config.temperature == 0
+        return self._llm_cache if enabled else None
+
+    def _llm_config(self) -> Optional[LLMConfig]:
+        """LLM settings of this agent, from its config or its provider."""
+        if self.config.llm is not None:
+            return self.config.llm
+        provider_config = getattr(self.llm, "config", None)
+        return provider_config if isinstance(provider_config, LLMConfig) else None
+
+    def _cache_key(self, proposal: Mapping[str, Any]) -> str:
+        """Cache key for this agent's evaluation of a proposal."""
+        llm_config = self._llm_config()
+        return LLMCache.make_key(
+            self.config.role,
+            llm_config.model if llm_config else None,
+            llm_config.temperature if llm_config else None,
+            # Caller-supplied ids aren't trusted: equal ids may hide different params
+            proposal.digest if isinstance(proposal, _SharedProposal) else _proposal_digest(proposal)
+        )
 
-            if result["confidence"] < self.config.min_confidence:
-                logger.warning(f"Low confidence decision: {result['confidence']}")
-                return {"decision": "abstain", "reason": "Low confidence"}
+    async def _query_once(
+        self,
+        cache_key: str,
+        context: Dict[str, Any],
+        cache: Optional[LLMCache]
+    ) -> Dict[str, Any]:
+        """Query the LLM for a vote while concurrent identical calls wait on it."""
+        future = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting; don't warn about an unretrieved exception
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[cache_key] = future
+        try:
+            # Format context for LLM
+            system_prompt, prompt = self._format_prompt(context)
+
+            # Get LLM response; with bounded reasoning, stop generating
+            # once the vote and enough reasoning have arrived
+            config = self.config
+            if config.batch_window is not None and system_prompt is self._system_prompt:
+                response = await self._batched_query(prompt)
+            elif config.max_reasoning_chars is not None:
+                response = await self._stream_vote(
+                    prompt, system_prompt, config.max_reasoning_chars
+                )
+            else:
+                response = await self.llm.query(
+                    prompt,
+                    system_prompt=system_prompt,
+                    expect_json=True,
+                    response_schema=_VOTE_SCHEMA
+                )
 
+            # Parse and validate response
+            result = self._parse_response(response)
+            if cache is not None:
+                await cache.set(cache_key, result)
+            future.set_result(result)
             return result
-
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
         except Exception as e:
-            logger.error(f"Error in evaluation: {str(e)}")
-            return {"error": str(e)}
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    async def _batched_query(self, prompt: str) -> Union[str, Dict[str, Any]]:
+        """Queue a proposal prompt for the micro-batcher and await its result."""
+        if self._batch_worker is None or self._batch_worker.done():
+            self._inbox = asyncio.Queue()
+            self._batch_worker = asyncio.create_task(self._run_batch_worker())
+        future = asyncio.get_running_loop().create_future()
+        await self._inbox.put((prompt, future))
+        return await future
+
+    async def _run_batch_worker(self) -> None:
+        """Coalesce prompts arriving within batch_window into one query."""
+        loop = asyncio.get_running_loop()
+        batch: List[tuple] = []
+        try:
+            while True:
+                batch = [await self._inbox.get()]
+                deadline = loop.time() + self.config.batch_window
+                while len(batch) < self.config.max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._inbox.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Resolve in the background so the next window opens immediately
+                task = asyncio.create_task(self._resolve_batch(batch))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+                batch = []
+        finally:
+            # Cancelled by cleanup: prompts collected but not yet sent get an answer too
+            _fail_pending(batch)
+
+    async def _resolve_batch(self, batch: List[tuple]) -> None:
+        """Query the LLM for a batch of prompts and settle their futures."""
+        try:
+            if len(batch) == 1:
+                # A lone prompt keeps the single-call prompt and latency
+                results = [await self.llm.query(
+                    batch[0][0],
+                    system_prompt=self._system_prompt,
+                    expect_json=True,
+                    response_schema=_VOTE_SCHEMA
+                )]
+            else:
+                prompt = "\n".join(
+                    f"Proposal {i}:\n{text}" for i, (text, _) in enumerate(batch, 1)
+                )
+                system_prompt = _MULTI_PROPOSAL_SYSTEM_TEMPLATE.format(
+                    role_prompt=self._role_prompt,
+                    count=len(batch)
+                )
+                response = await self.llm.query(
+                    prompt,
+                    system_prompt=system_prompt,
+                    expect_json=True,
+                    response_schema=_EVALUATIONS_SCHEMA
+                )
+                if isinstance(response, str):
+                    response = _loads(response)
+                results = response.get("evaluations") if isinstance(response, dict) else None
+                if not isinstance(results, list) or len(results) != len(batch):
+                    raise ValueError("Expected one evaluation per proposal")
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            _fail_pending(batch, e)
+        finally:
+            # Cancelled by cleanup before the LLM answered
+            _fail_pending(batch)
+
+    async def _stream_vote(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_reasoning: int
+    ) -> Union[str, Dict[str, Any]]:
+        """Stream a vote and cut generation once the reasoning is long enough.
+
+        Returns the vote as a dict when cut short, otherwise the full text.
+        """
+        text = ""
+        chunks = self.llm.stream(
+            prompt,
+            system_prompt=system_prompt,
+            expect_json=True,
+            response_schema=_VOTE_SCHEMA
+        )
+        try:
+            async for chunk in chunks:
+                text += chunk
+                head = _STREAM_VOTE_HEAD_RE.match(text)
+                if not head:
+                    continue
+                body = _JSON_STRING_BODY_RE.match(text, head.end()).group()
+                if len(body) < max_reasoning:
+                    continue
+                raw = body[:max_reasoning].rstrip("\\")
+                try:
+                    reasoning = _loads(f'"{raw}"')
+                except ValueError:
+                    reasoning = raw
+                return {
+                    "decision": head.group(1),
+                    "confidence": float(head.group(2)),
+                    "reasoning": reasoning
+                }
+        finally:
+            await chunks.aclose()
+        return text
+
+    def _apply_min_confidence(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Downgrade decisions below this agent's confidence floor to abstain."""
+        confidence = result["confidence"]
+        if confidence < self.config.min_confidence:
+            logger.warning("Low confidence decision: %s", confidence)
+            return {
+                "decision": "abstain",
+                "confidence": confidence,
+                "reasoning": "Low confidence"
+            }
+        return result
 
-    def _format_prompt(self, context: Dict[str, Any]) -> str:
-        """Format context into LLM prompt."""
-        proposal = context.get("proposal", {})
+    def _format_prompt(self, context: Dict[str, Any]) -> Tuple[str, str]:
+        """Format context into (system prompt, user prompt) for the LLM."""
         role_prompt = context.get("role_prompt", "")
+        if role_prompt is self._role_prompt:
+            # The usual case: evaluate_proposal passed this agent's own prompt
+            system_prompt = self._system_prompt
+        else:
+            system_prompt = _eval_system_prompt(role_prompt)
+        return system_prompt, _format_proposal(context.get("proposal", {}))
+
+    @staticmethod
+    def _format_batch_prompt(agents: List['SwarmAgent'], proposal: Mapping[str, Any]) -> Tuple[str, str]:
+        """Format one (system, user) prompt pair covering every agent's role."""
+        perspectives = "\n\n".join(
+            f"Perspective {i} ({agent.config.role}):\n{agent._get_role_prompt()}"
+            for i, agent in enumerate(agents, 1)
+        )
+        system_prompt = _BATCH_EVAL_SYSTEM_TEMPLATE.format(
+            count=len(agents),
+            perspectives=perspectives
+        )
+        return system_prompt, _format_proposal(proposal)
 
-        return f"""
-        {role_prompt}
-
-        Proposal to Evaluate:
-        Type: {proposal.get('type')}
-        Parameters: {json.dumps(proposal.get('params', {}), indent=2)}
-        Proposer: {proposal.get('proposer')}
+    def _parse_response(self, response: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Parse and validate LLM response.
 
-        Provide your analysis and decision in JSON format with:
-        - decision: string (approve/reject/abstain)
-        - confidence: float (0-1)
-        - reasoning: string
+        Providers in JSON mode return the object already parsed; raw text
+        from other providers is decoded here.
         """
+        if isinstance(response, dict):
+            return self._validate_result(response)
+
+        match = _FAST_VOTE_RE.fullmatch(response)
+        if match:
+            # Already valid by construction of the pattern
+            return {
+                "decision": match.group(1),
+                "confidence": float(match.group(2)),
+                "reasoning": match.group(3)
+            }
 
-    def _parse_response(self, response: str) -> Dict[str, Any]:
-        """Parse and validate LLM response."""
         try:
-            result = json.loads(response)
-            required_fields = ["decision", "confidence", "reasoning"]
+            return self._validate_result(_loads(response))
+        except json.JSONDecodeError:
+            raise ValueError("Invalid JSON response from LLM")
 
-            if not all(field in result for field in required_fields):
-                raise ValueError("Missing required fields in response")
+    def _validate_result(self, result: Any) -> Dict[str, Any]:
+        """Validate a single parsed evaluation."""
+        if _validate_vote is not None:
+            _validate_vote(result)
+            return result
 
-            # Validate decision values
-            if result["decision"] not in ["approve", "reject", "abstain"]:
-                raise ValueError("Invalid decision value")
+        if not isinstance(result, dict):
+            raise ValueError("Evaluation must be a JSON object")
 
-            # Validate confidence range
-            if not isinstance(result["confidence"], (int, float)) or not 0 <= result["confidence"] <= 1:
-                raise ValueError("Confidence must be a float between 0 and 1")
+        required_fields = ["decision", "confidence", "reasoning"]
 
-            return result
+        if not all(field in result for field in required_fields):
+            raise ValueError("Missing required fields in response")
 
-        except json.JSONDecodeError:
-            raise ValueError("Invalid JSON response from LLM")
+        # Validate decision values
+        if result["decision"] not in ["approve", "reject", "abstain"]:
+            raise ValueError("Invalid decision value")
+
+        # Validate confidence range
+        if not isinstance(result["confidence"], (int, float)) or not 0 <= result["confidence"] <= 1:
+            raise ValueError("Confidence must be a float between 0 and 1")
+
+        return result
 
     async def cleanup(self) -> None:
         """Clean up agent resources."""
         self._initialized = False
         self._is_running = False
         self.swarm_peers = []
+        self._peer_ids.clear()
+        if self._batch_worker is not None:
+            self._batch_worker.cancel()
+            self._batch_worker = None
+        for task in list(self._batch_tasks):
+            task.cancel()
+        # Prompts still queued for the micro-batcher will never be sent
+        if self._inbox is not None:
+            while not self._inbox.empty():
+                _fail_pending([self._inbox.get_nowait()])
+            self._inbox = None
         logger.info("SwarmAgent cleaned up")
 
     async def __aenter__(self):
@@ -262,5 +932,6 @@ Your primary responsibility is optimizing execution and performance."""
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        # The provider is shared or the caller's; see close_shared_llm_providers
         await self.cleanup()
         return None
@@ -4,25 +4,259 @@ Simple web search integration using DuckDuckGo.
 """
 
 import asyncio
-from typing import List, Dict, Any
+import importlib.util
+import re
+import time
+from html import unescape
+from typing import List, Dict, Any, Optional, Tuple
 import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import quote_plus
 
+try:
+    # Lexbor-backed C parser; much faster than bs4 on result pages
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from lxml import etree, html as lxml_html
+    from lxml.etree import XPath
+except ImportError:
+    lxml_html = None
+
+
+# DuckDuckGo's result markup is regular enough to match directly; the DOM
+# parsers below are only needed when it changes shape
+_TITLE_RE = re.compile(
+    r'<a\s([^>]*\bclass="[^"]*\bresult__a\b[^"]*"[^>]*)>(.*?)</a>', re.DOTALL
+)
+_SNIPPET_RE = re.compile(
+    r'<a\s[^>]*\bclass="[^"]*\bresult__snippet\b[^"]*"[^>]*>(.*?)</a>', re.DOTALL
+)
+_HREF_RE = re.compile(r'\bhref="([^"]*)"')
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _regex_text(fragment: str) -> str:
+    """Stripped text of an HTML fragment, joined like bs4's get_text(strip=True)."""
+    return "".join(unescape(part).strip() for part in _TAG_RE.split(fragment))
+
+
+def _parse_with_regex(html: str, max_results: int) -> List[Dict[str, str]]:
+    """Extract search results with a regex sweep, without building a DOM."""
+    titles = list(_TITLE_RE.finditer(html))
+    results = []
+    for i, title in enumerate(titles[:max_results]):
+        # A result's snippet sits between its title and the next result's
+        end = titles[i + 1].start() if i + 1 < len(titles) else len(html)
+        snippet = _SNIPPET_RE.search(html, title.end(), end)
+        href = _HREF_RE.search(title.group(1))
+        results.append({
+            "title": _regex_text(title.group(2)),
+            "url": unescape(href.group(1)) if href else "",
+            "snippet": _regex_text(snippet.group(1)) if snippet else ""
+        })
+    return results
+
+
+def _parse_with_selectolax(html: str, max_results: int) -> List[Dict[str, str]]:
+    """Extract search results with selectolax."""
+    results = []
+    for result in LexborHTMLParser(html).css(".result"):
+        title_elem = result.css_first(".result__title a")
+        if title_elem is None:
+            continue
+        snippet_elem = result.css_first(".result__snippet")
+        results.append({
+            "title": title_elem.text(strip=True),
+            "url": title_elem.attributes.get("href") or "",
+            "snippet": snippet_elem.text(strip=True) if snippet_elem is not None else ""
+        })
+        if len(results) >= max_results:
+            break
+    return results
+
+
+if lxml_html is not None:
+    # Compiled once; CSS selectors would be translated to XPath on every call
+    _RESULTS_XP = XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' result ')]")
+    _TITLE_XP = XPath(
+        ".//*[contains(concat(' ', normalize-space(@class), ' '), ' result__title ')]//a"
+    )
+    _SNIPPET_XP = XPath(
+        ".//*[contains(concat(' ', normalize-space(@class), ' '), ' result__snippet ')]"
+    )
+
+
+def _lxml_text(elem: Any) -> str:
+    """Stripped text of an element, joined like bs4's get_text(strip=True)."""
+    return "".join(part.strip() for part in elem.itertext())
+
+
+def _lxml_result(result: Any) -> Optional[Dict[str, str]]:
+    """Extract one search result from its lxml element, if it has a title."""
+    titles = _TITLE_XP(result)
+    if not titles:
+        return None
+    snippets = _SNIPPET_XP(result)
+    return {
+        "title": _lxml_text(titles[0]),
+        "url": titles[0].get("href", ""),
+        "snippet": _lxml_text(snippets[0]) if snippets else ""
+    }
+
+
+def _parse_with_lxml(html: str, max_results: int) -> List[Dict[str, str]]:
+    """Extract search results with lxml and precompiled XPath."""
+    results = []
+    for elem in _RESULTS_XP(lxml_html.fromstring(html)):
+        result = _lxml_result(elem)
+        if result is None:
+            continue
+        results.append(result)
+        if len(results) >= max_results:
+            break
+    return results
+
+
+async def _stream_parse_with_lxml(
+    content: aiohttp.StreamReader,
+    encoding: str,
+    max_results: int
+) -> List[Dict[str, str]]:
+    """Extract search results while the page is still downloading.
+
+    Each result block is handled as soon as its closing tag arrives and
+    then cleared, so the full page is never held as a string or tree.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="div", encoding=encoding)
+    results: List[Dict[str, str]] = []
+
+    def take_events() -> bool:
+        for _, elem in parser.read_events():
+            if "result" not in (elem.get("class") or "").split():
+                continue
+            result = _lxml_result(elem)
+            elem.clear()
+            if result is not None:
+                results.append(result)
+                if len(results) >= max_results:
+                    return True
+        return False
+
+    async for chunk in content.iter_chunked(16384):
+        parser.feed(chunk)
+        if take_events():
+            return results
+    parser.close()
+    take_events()
+    return results
+
+
+def _has_result_class(value: Any) -> bool:
+    """Match the "result" class token; while parsing, bs4 passes the raw attribute."""
+    return value is not None and "result" in value.split()
+
+
+# Only result blocks are built into the bs4 tree; everything else is skipped
+_RESULT_STRAINER = SoupStrainer("div", class_=_has_result_class)
+_BS4_FEATURES = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+
+
+def _bs4_text(elem: Any) -> str:
+    """Stripped text of a bs4 element, skipping the descendant walk for plain text."""
+    text = elem.string
+    return text.strip() if text is not None else elem.get_text(strip=True)
+
+
+def _parse_with_bs4(html: str, max_results: int) -> List[Dict[str, str]]:
+    """Extract search results with BeautifulSoup."""
+    soup = BeautifulSoup(html, _BS4_FEATURES, parse_only=_RESULT_STRAINER)
+
+    results = []
+    for result in soup.find_all("div", class_="result", recursive=False):
+        # Extract title and URL
+        title_block = result.find(class_="result__title")
+        title_elem = title_block.find("a") if title_block else None
+        if not title_elem:
+            continue
+
+        title = _bs4_text(title_elem)
+        url = title_elem.get("href", "")
+
+        # Extract snippet
+        snippet_elem = result.find(class_="result__snippet")
+        snippet = _bs4_text(snippet_elem) if snippet_elem else ""
+
+        results.append({
+            "title": title,
+            "url": url,
+            "snippet": snippet
+        })
+
+        if len(results) >= max_results:
+            break
+
+    return results
+
+
+# Fastest available parser, chosen once. Without selectolax, lxml parses
+# the response incrementally as it arrives instead of after buffering it.
+if LexborHTMLParser is not None:
+    _parse_results = _parse_with_selectolax
+elif lxml_html is not None:
+    _parse_results = _parse_with_lxml
+else:
+    _parse_results = _parse_with_bs4
+_STREAM_PARSE = LexborHTMLParser is None and lxml_html is not None
+
+
+def _parse_page(html: str, max_results: int) -> List[Dict[str, str]]:
+    """Parse a buffered results page, falling back to the DOM parser."""
+    return _parse_with_regex(html, max_results) or _parse_results(html, max_results)
+
+# Distinct queries whose results are kept
+_CACHE_MAX_SIZE = 256
+
+# Longest Retry-After honoured; a search shouldn't stall callers for longer
+_MAX_RETRY_DELAY = 10.0
+
+# DuckDuckGo time filters: past day, week, month
+_TIME_FILTERS = ("d", "w", "m")
+
+
+def _compose_news_query(query: str, max_age_days: int) -> Tuple[str, str]:
+    """Build the (query, time filter) pair for a news search."""
+    # Add news-specific terms and the narrowest filter covering max_age_days
+    return (
+        f"{query} news article",
+        _TIME_FILTERS[0 if max_age_days == 1 else 1 if max_age_days <= 7 else 2]
+    )
+
+
 class WebSearchManager:
     """
     Manages web searches using DuckDuckGo.
     Provides simple, privacy-focused web search capabilities.
     """
 
-    def __init__(self, max_results: int = 5):
+    def __init__(self, max_results: int = 5, max_retries: int = 3, cache_ttl: float = 60.0):
         """Initialize web search manager.
         
         Args:
             max_results: Maximum number of results to return
+            max_retries: Attempts per search on rate limits and server errors
+            cache_ttl: Seconds a query's results are reused
         """
         self.max_results = max_results
+        self.max_retries = max_retries
+        self.cache_ttl = cache_ttl
         self._session = None
+
+        # (query, time_filter) -> (fetched at, results), and the searches in flight
+        self._cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[Dict[str, str]]]] = {}
+        self._inflight: Dict[Tuple[str, Optional[str]], asyncio.Future] = {}
         
         # DuckDuckGo search URL
         self.search_url = "https://html.duckduckgo.com/html/"
@@ -35,7 +269,18 @@ class WebSearchManager:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(headers=self.headers)
+            # Keep connections alive and DNS cached between searches
+            connector = aiohttp.TCPConnector(
+                limit=128,
+                limit_per_host=64,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10, connect=3)
+            )
         return self._session
     
     async def search(
@@ -53,6 +298,48 @@ class WebSearchManager:
         Returns:
             List of search results with title, snippet, and URL
         """
+        key = (query, time_filter)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return list(cached[1])
+
+        # Concurrent identical searches share one request
+        while True:
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return list(await asyncio.shield(pending))
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The first caller was cancelled; the next one searches
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            results = await self._fetch(query, time_filter)
+            if results:
+                # Failed searches come back empty and are retried next time
+                self._cache.pop(key, None)
+                self._cache[key] = (time.monotonic(), results)
+                if len(self._cache) > _CACHE_MAX_SIZE:
+                    # Dicts keep insertion order, so the first key is the oldest
+                    del self._cache[next(iter(self._cache))]
+            future.set_result(results)
+            return list(results)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _fetch(
+        self,
+        query: str,
+        time_filter: Optional[str]
+    ) -> List[Dict[str, str]]:
+        """Run one DuckDuckGo search request and parse the results."""
         try:
             session = await self._get_session()
             
@@ -64,45 +351,37 @@ class WebSearchManager:
             if time_filter:
                 params["df"] = time_filter
             
-            # Make search request
-            async with session.post(
-                self.search_url,
-                data=params
-            ) as response:
-                if response.status != 200:
-                    return []
-                
-                # Parse results
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-                
-                results = []
-                for result in soup.select(".result"):
-                    # Extract title and URL
-                    title_elem = result.select_one(".result__title a")
-                    if not title_elem:
-                        continue
-                        
-                    title = title_elem.get_text(strip=True)
-                    url = title_elem.get("href", "")
-                    
-                    # Extract snippet
-                    snippet_elem = result.select_one(".result__snippet")
-                    snippet = (
-                        snippet_elem.get_text(strip=True)
-                        if snippet_elem else ""
-                    )
-                    
-                    results.append({
-                        "title": title,
-                        "url": url,
-                        "snippet": snippet
-                    })
-                    
-                    if len(results) >= self.max_results:
-                        break
-                
-                return results
+            # Make search request, backing off on rate limits and server errors
+            for attempt in range(self.max_retries):
+                delay = 0.25 * 2 ** attempt
+                try:
+                    async with session.post(
+                        self.search_url,
+                        data=params
+                    ) as response:
+                        if response.status == 200:
+                            # Parse results
+                            if _STREAM_PARSE:
+                                return await _stream_parse_with_lxml(
+                                    response.content,
+                                    response.charset or "utf-8",
+                                    self.max_results
+                                )
+                            html = await response.text()
+                            return _parse_page(html, self.max_results)
+                        if response.status != 429 and response.status < 500:
+                            return []
+                        retry_after = response.headers.get("Retry-After", "")
+                        if retry_after.isdigit():
+                            delay = min(float(retry_after), _MAX_RETRY_DELAY)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt + 1 == self.max_retries:
+                        raise
+
+                if attempt + 1 < self.max_retries:
+                    await asyncio.sleep(delay)
+
+            return []
                 
         except Exception as e:
             print(f"Search error: {str(e)}")
@@ -123,17 +402,7 @@ class WebSearchManager:
         Returns:
             List of news articles
         """
-        # Add news-specific terms
-        news_query = f"{query} news article"
-        
-        # Use appropriate time filter
-        time_filter = (
-            "d" if max_age_days == 1
-            else "w" if max_age_days <= 7
-            else "m"
-        )
-        
-        return await self.search(news_query, time_filter)
+        return await self.search(*_compose_news_query(query, max_age_days))
     
     async def get_market_news(
         self,
@@ -151,7 +420,7 @@ class WebSearchManager:
             List of relevant news articles
         """
         query = f"{symbol} Protocol crypto price news analysis"
-        return await self.search_news(query, max_age_days)
+        return await self.search(*_compose_news_query(query, max_age_days))
     
     async def close(self):
         """Clean up resources."""
@@ -40,34 +40,33 @@ import os
 import sys
 import asyncio
 import logging
+from contextlib import AsyncExitStack
 from typing import Optional, Dict, Any
 from near_swarm.plugins import PluginLoader
 from near_swarm.core.exceptions import AgentError
+from near_swarm.core.event_loop import enable_uvloop
 
 # Configure logging
 import colorlog
 
-handler = colorlog.StreamHandler()
-handler.setFormatter(colorlog.ColoredFormatter(
-    '%(log_color)s%(message)s',
-    log_colors={
-        'DEBUG': 'cyan',
-        'INFO': 'green',
-        'WARNING': 'yellow',
-        'ERROR': 'red',
-        'CRITICAL': 'red,bg_white',
-    }
-))
 logger = logging.getLogger(__name__)
-logger.handlers = []  # Clear existing handlers
-logger.addHandler(handler)
+if not logger.handlers:  # Don't stack handlers when the module is re-imported
+    handler = colorlog.StreamHandler()
+    handler.setFormatter(colorlog.ColoredFormatter(
+        '%(log_color)s%(message)s',
+        log_colors={
+            'DEBUG': 'cyan',
+            'INFO': 'green',
+            'WARNING': 'yellow',
+            'ERROR': 'red',
+            'CRITICAL': 'red,bg_white',
+        }
+    ))
+    logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
-async def run_voice_demo() -> None:
-    """Run the voice-enabled portfolio assistant demo."""
-    loader = PluginLoader()
-    plugin = None
-    
+async def run_voice_demo(loader: PluginLoader) -> None:
+    """Run the voice-enabled portfolio assistant demo with a shared plugin loader."""
     try:
         print("\n=== 🎙️ Voice Portfolio Assistant ===")
         print("This demo shows how AI can provide natural voice interactions")
@@ -87,15 +86,9 @@ async def run_voice_demo() -> None:
         print(f"\nError: {e}")
     except Exception as e:
         print(f"\nUnexpected error: {e}")
-    finally:
-        if plugin:
-            await loader.unload_plugin("portfolio-advisor")
 
-async def run_market_demo() -> None:
-    """Run the market analysis demo."""
-    loader = PluginLoader()
-    plugin = None
-    
+async def run_market_demo(loader: PluginLoader) -> None:
+    """Run the market analysis demo with a shared plugin loader."""
     try:
         print("\n=== 🧠 Market Analysis Demo ===")
         print("This demo shows how AI analyzes:")
@@ -137,9 +130,6 @@ async def run_market_demo() -> None:
         print(f"\nError: {e}")
     except Exception as e:
         print(f"\nUnexpected error: {e}")
-    finally:
-        if plugin:
-            await loader.unload_plugin("market-analyzer")
 
 async def run_demo(demo_type: Optional[str] = None) -> None:
     """Run the NEAR Swarm Intelligence demo."""
@@ -163,11 +153,16 @@ async def run_demo(demo_type: Optional[str] = None) -> None:
             return
     
     try:
-        if demo_type in ['voice', 'all']:
-            await run_voice_demo()
-            
-        if demo_type in ['market', 'all']:
-            await run_market_demo()
+        # Resources shared by every demo section are released once, at the end
+        async with AsyncExitStack() as stack:
+            loader = PluginLoader()
+            stack.push_async_callback(loader.cleanup)
+
+            if demo_type in ['voice', 'all']:
+                await run_voice_demo(loader)
+                
+            if demo_type in ['market', 'all']:
+                await run_market_demo(loader)
             
     except KeyboardInterrupt:
         print("\n\n👋 Demo stopped by user")
@@ -178,7 +173,12 @@ async def run_demo(demo_type: Optional[str] = None) -> None:
 if __name__ == "__main__":
     try:
         demo_type = sys.argv[1] if len(sys.argv) > 1 else None
-        asyncio.run(run_demo(demo_type))
+        enable_uvloop()
+        if hasattr(asyncio, "Runner"):  # Python 3.11+
+            with asyncio.Runner(debug=False) as runner:
+                runner.run(run_demo(demo_type))
+        else:
+            asyncio.run(run_demo(demo_type))
     except KeyboardInterrupt:
         print("\n\n👋 Demo stopped by user")
     except Exception as e:
@@ -5,17 +5,43 @@ Use this template to create your own multi-agent strategy.
 
 import asyncio
 import logging
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
+from near_swarm.core.llm_provider import LLMConfig, create_llm_provider
 from near_swarm.core.market_data import MarketDataManager
-from near_swarm.core.agent import AgentConfig
+from near_swarm.core.event_loop import enable_uvloop
 from near_swarm.core.swarm_agent import SwarmAgent, SwarmConfig
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def get_llm_config() -> LLMConfig:
+    """Load LLM configuration from the environment once per process."""
+    load_dotenv()
+    return LLMConfig(
+        provider=os.getenv("LLM_PROVIDER", "hyperbolic"),
+        api_key=os.getenv("LLM_API_KEY", ""),
+        model=os.getenv("LLM_MODEL", "meta-llama/Llama-3.3-70B-Instruct"),
+        api_url=os.getenv("LLM_API_URL", "https://api.hyperbolic.xyz/v1")
+    )
+
+
+# One proposal per run; slots drop the per-instance __dict__ (3.10+)
+@dataclass(**({"slots": True} if sys.version_info >= (3, 10) else {}))
+class TradeProposal:
+    """A proposal for the swarm to evaluate."""
+    type: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
 class Strategy:
     """Your custom strategy implementation."""
     
@@ -24,25 +50,27 @@ class Strategy:
         self.market = MarketDataManager()
         self.agents = []
         self.config = self._load_config()
+        self.llm = None
     
-    def _load_config(self) -> AgentConfig:
-        """Load configuration from environment."""
-        load_dotenv()
-        return AgentConfig.from_env()
+    def _load_config(self) -> LLMConfig:
+        """Load LLM configuration; shared by every Strategy in the process."""
+        return get_llm_config()
     
     async def initialize_agents(self):
         """Initialize and configure your swarm agents."""
-        # Example: Create a market analyzer
-        market_analyzer = SwarmAgent(
-            config=self.config,
-            swarm_config=SwarmConfig(
-                role="market_analyzer",
-                min_confidence=0.7
+        # One provider (and connection pool) serves every agent
+        self.llm = create_llm_provider(self.config)
+
+        # Example: a market analyzer; add more roles as needed...
+        for role in ("market_analyzer", "risk_manager", "strategy_optimizer"):
+            agent = SwarmAgent(
+                SwarmConfig(role=role, min_confidence=0.7, timeout=30.0, llm=self.config),
+                llm_provider=self.llm
             )
-        )
-        self.agents.append(market_analyzer)
-        
-        # Add more agents as needed...
+            await agent.initialize()
+            self.agents.append(agent)
+
+        await self.agents[0].join_swarm(self.agents[1:])
     
     async def analyze_opportunity(self) -> Dict[str, Any]:
         """
@@ -61,20 +89,20 @@ class Strategy:
             }
         }
     
-    async def create_proposal(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_proposal(self, analysis: Dict[str, Any]) -> TradeProposal:
         """
         Create a proposal for the swarm to evaluate.
         Args:
             analysis: Results from analyze_opportunity()
         Returns:
-            Dict[str, Any]: The proposal
+            TradeProposal: The proposal
         """
-        return {
-            "type": "your_action_type",
-            "params": {
+        return TradeProposal(
+            "your_action_type",
+            {
                 # Add your proposal parameters
             }
-        }
+        )
     
     async def execute_action(self, consensus: Dict[str, Any]):
         """
@@ -82,11 +110,11 @@ class Strategy:
         Args:
             consensus: The swarm's decision
         """
-        if consensus["approved"]:
-            logger.info("Executing approved action...")
+        if consensus["consensus"]:
+            logger.debug("Executing approved action...")
             # Implement your execution logic
         else:
-            logger.info("Action not approved by swarm")
+            logger.debug("Action not approved by swarm")
     
     async def run(self):
         """Main strategy execution loop."""
@@ -96,6 +124,8 @@ class Strategy:
             
             # 2. Analyze opportunity
             analysis = await self.analyze_opportunity()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Analysis: %s", analysis)
             
             # 3. Create proposal
             proposal = await self.create_proposal(analysis)
@@ -103,23 +133,39 @@ class Strategy:
             # 4. Get swarm consensus
             if self.agents:
                 consensus = await self.agents[0].propose_action(
-                    action_type=proposal["type"],
-                    params=proposal["params"]
+                    action_type=proposal.type,
+                    params=proposal.params
                 )
                 
                 # 5. Execute if approved
                 await self.execute_action(consensus)
+
+                # One structured record per run instead of a line per step
+                payload = {
+                    "near_price": analysis.get("data", {}).get("price"),
+                    "action": proposal.type,
+                    "consensus": consensus["consensus"],
+                    "approval_rate": consensus["approval_rate"],
+                    "early_abort": consensus.get("early_abort", False),
+                    "reasoning": consensus["reasons"]
+                }
+                logger.info("swarm_result %s", payload, extra={"data": payload})
             
         except Exception as e:
-            logger.error(f"Strategy error: {str(e)}")
+            logger.error("Strategy error: %s", e)
             raise
         finally:
-            # Cleanup
-            await self.market.close()
-            for agent in self.agents:
-                await agent.close()
+            # Tear everything down concurrently; one failure doesn't skip the rest
+            await asyncio.gather(
+                self.market.close(),
+                *(agent.cleanup() for agent in self.agents),
+                return_exceptions=True
+            )
+            if self.llm is not None:
+                await self.llm.close()
 
 if __name__ == "__main__":
-    # Run the strategy
+    # Run the strategy, on uvloop when it is installed
+    enable_uvloop()
     strategy = Strategy()
     asyncio.run(strategy.run()) 
\ No newline at end of file
@@ -129,9 +129,11 @@ class ArbitragePlugin(AgentPlugin):
             if not pair:
                 raise AgentError("Missing required parameter: pair")
             
-            # Get market data
-            dex_prices = await self._get_dex_prices(pair)
-            market_context = await self._get_market_context()
+            # Get market data; prices and context are independent
+            dex_prices, market_context = await asyncio.gather(
+                self._get_dex_prices(pair),
+                self._get_market_context()
+            )
             
             # Analyze with LLM
             analysis = await self._analyze_with_llm(dex_prices, market_context)
@@ -188,26 +190,40 @@ class ArbitragePlugin(AgentPlugin):
     
     async def _get_dex_prices(self, pair: str) -> List[Dict[str, Any]]:
         """Get prices from configured DEXes."""
+        dexes = self.config.market.target_dexes
+        # Query every DEX at once; latency is the slowest DEX, not the sum
+        results = await asyncio.gather(
+            *(self.market.get_dex_price(dex, pair) for dex in dexes),
+            return_exceptions=True
+        )
         prices = []
-        for dex in self.config.market.target_dexes:
+        for dex, price in zip(dexes, results):
+            if isinstance(price, Exception):
+                logger.warning(f"Failed to get price from {dex}: {price}")
+                continue
             try:
-                price = await self.market.get_dex_price(dex, pair)
                 prices.append({
                     "dex": dex,
                     "price": price["price"],
                     "liquidity": price["liquidity"]
                 })
-            except Exception as e:
+            except (KeyError, TypeError) as e:
+                # A malformed response skips this DEX, not the whole evaluation
                 logger.warning(f"Failed to get price from {dex}: {e}")
         return prices
     
     async def _get_market_context(self) -> Dict[str, Any]:
         """Get relevant market context."""
         try:
+            network, gas_price, volatility = await asyncio.gather(
+                self.near.get_network_stats(),
+                self.near.get_gas_price(),
+                self.market.get_market_volatility()
+            )
             return {
-                "network": await self.near.get_network_stats(),
-                "gas_price": await self.near.get_gas_price(),
-                "market_volatility": await self.market.get_market_volatility()
+                "network": network,
+                "gas_price": gas_price,
+                "market_volatility": volatility
             }
         except Exception as e:
             logger.error(f"Failed to get market context: {e}")
@@ -0,0 +1,41 @@
+"""
+Tests for the LLM evaluation cache
+"""
+
+import pytest
+
+from near_swarm.core.llm_cache import LLMCache
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used():
+    """Test the in-memory cache stays within max_size."""
+    cache = LLMCache(max_size=2)
+    await cache.set("a", {"decision": "approve"})
+    await cache.set("b", {"decision": "reject"})
+    assert await cache.get("a") == {"decision": "approve"}
+
+    await cache.set("c", {"decision": "abstain"})
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert cache.stats == {"hits": 2, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_survives_new_instance(tmp_path):
+    """Test results written to SQLite are found by a fresh cache."""
+    path = tmp_path / "llm_cache.sqlite3"
+    key = LLMCache.make_key("risk_manager", "model", 0.0, "proposal")
+    vote = {"decision": "approve", "confidence": 0.9, "reasoning": "Low risk"}
+
+    first = LLMCache(path=path)
+    await first.set(key, vote)
+    first.close()
+
+    second = LLMCache(path=path)
+    try:
+        assert await second.get(key) == vote
+        assert await second.get("missing") is None
+        assert second.stats == {"hits": 1, "misses": 1}
+    finally:
+        second.close()
@@ -3,12 +3,15 @@ Core NEAR Protocol Integration Tests
 Tests essential functionality for interacting with NEAR Protocol
 """
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
 import os
 from dotenv import load_dotenv
 
-from near_swarm.core.near_integration import NEARConnection
+from near_swarm.core.near_integration import NEARConnection, NEARConfig, InvalidKeyError
 
 
 @pytest.fixture
@@ -35,6 +38,55 @@ async def test_connection_initialization():
     assert connection.node_url == "https://rpc.testnet.fastnear.com"
 
 
+def test_private_key_validation():
+    """Test private key cleaning and validation without a network connection."""
+    key = "ed25519:3D4YudUQRE39Lc4JHghuB5WM8kbgDDa34mnrEP5DdTApVH81af3e7MvFronz1F2u9wsnS4jx4nX4UNqm8M2n8acG"
+
+    # Quotes and whitespace from .env files are stripped
+    config = NEARConfig(network="testnet", account_id="test.testnet", private_key=f" '{key}' ")
+    assert config.private_key == key
+
+    with pytest.raises(InvalidKeyError):
+        NEARConfig(network="testnet", account_id="test.testnet", private_key=key.split(":")[1])
+
+    with pytest.raises(InvalidKeyError):
+        NEARConfig(network="testnet", account_id="test.testnet", private_key="ed25519:0OIl")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_send_keeps_lock_until_transfer_finishes():
+    """Test a cancelled caller doesn't let a second send race the running one."""
+    # Account() fetches the account over RPC
+    with patch("near_swarm.core.near_integration.Account"):
+        connection = NEARConnection(
+            network="testnet",
+            account_id="test.testnet",
+            private_key="ed25519:3D4YudUQRE39Lc4JHghuB5WM8kbgDDa34mnrEP5DdTApVH81af3e7MvFronz1F2u9wsnS4jx4nX4UNqm8M2n8acG"
+        )
+    release = threading.Event()
+    running = []
+
+    def send_money(receiver_id, amount):
+        running.append(receiver_id)
+        assert len(running) == 1, "sends overlapped"
+        release.wait(5)
+        running.remove(receiver_id)
+        return {"transaction_outcome": {"id": "hash"}}
+
+    connection.account = Mock(send_money=send_money)
+
+    first = asyncio.ensure_future(connection.send_transaction("a.testnet", 1))
+    await asyncio.sleep(0.05)
+    first.cancel()
+    second = asyncio.ensure_future(connection.send_transaction("b.testnet", 1))
+    await asyncio.sleep(0.05)
+    assert running == ["a.testnet"]
+
+    release.set()
+    assert (await second)["transaction_id"] == "hash"
+    assert first.cancelled()
+
+
 @pytest.mark.asyncio
 async def test_env_configuration():
     """Test that environment configuration is valid."""
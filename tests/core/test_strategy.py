@@ -0,0 +1,59 @@
+"""
+Tests for the base Strategy helpers
+"""
+
+import asyncio
+
+import pytest
+
+from near_swarm.core.strategy import Strategy
+
+
+class ConcreteStrategy(Strategy):
+    """Minimal strategy for exercising the base class."""
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def execute(self):
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_run_all_keeps_order_and_returns_exceptions():
+    """Test results follow agent order and failures come back in place."""
+    strategy = ConcreteStrategy(["slow", "fail", "fast"])
+
+    async def fn(agent):
+        if agent == "fail":
+            raise ValueError("agent down")
+        await asyncio.sleep(0.02 if agent == "slow" else 0)
+        return agent.upper()
+
+    results = await strategy.run_all(fn)
+    assert results[0] == "SLOW"
+    assert isinstance(results[1], ValueError)
+    assert results[2] == "FAST"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count, expected_peak", [(4, 4), (40, 32)])
+async def test_run_all_caps_concurrency_for_agents_added_later(count, expected_peak):
+    """Test the concurrency cap follows the current agent list."""
+    strategy = ConcreteStrategy([])
+    strategy.agents.extend(range(count))
+    active = 0
+    peak = 0
+
+    async def fn(agent):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    await strategy.run_all(fn)
+    assert peak == expected_peak
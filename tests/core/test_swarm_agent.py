@@ -3,11 +3,15 @@ Core Swarm Agent Tests
 Tests essential functionality for NEAR Swarm Intelligence
 """
 
+import asyncio
+import dataclasses
+import json
+
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 
 from near_swarm.core.agent import AgentConfig
-from near_swarm.core.swarm_agent import SwarmAgent, SwarmConfig
+from near_swarm.core.swarm_agent import SwarmAgent, SwarmConfig, _proposal_digest
 
 
 @pytest.fixture
@@ -47,6 +51,13 @@ async def test_swarm_config_validation():
     assert config.role == "market_analyzer"
     assert config.min_confidence == 0.7
 
+    # The vote deadline defaults to something an LLM round trip can meet
+    assert SwarmConfig(role="market_analyzer").timeout == 30.0
+
+    # Config is shared by reference on every vote, so it can't be mutated
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.min_votes = 1
+
     # Test invalid confidence
     with pytest.raises(ValueError):
         SwarmConfig(
@@ -146,3 +157,548 @@ async def test_llm_evaluation_error_handling(agent_config, swarm_config):
             assert result["decision"] == False
             assert result["confidence"] == 0.0
             assert "LLM API error" in result["reasoning"]
+
+
+class ConcreteSwarmAgent(SwarmAgent):
+    """SwarmAgent with the plugin execute hook filled in for tests."""
+
+    async def execute(self, operation=None, **kwargs):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_join_swarm_is_idempotent(swarm_config):
+    """Test joining twice doesn't duplicate peers on either side."""
+    agent = ConcreteSwarmAgent(swarm_config)
+    peers = [ConcreteSwarmAgent(SwarmConfig(role=f"peer_{i}")) for i in range(3)]
+
+    await agent.join_swarm(peers)
+    await agent.join_swarm(peers)
+
+    assert agent.swarm_peers == peers
+    for peer in peers:
+        assert peer.swarm_peers == [agent]
+
+    # Passing the whole swarm, including the agent itself, is safe
+    await peers[0].join_swarm([agent] + peers)
+    assert peers[0] not in peers[0].swarm_peers
+    assert peers[0].swarm_peers == [agent, peers[1], peers[2]]
+
+
+@pytest.mark.asyncio
+async def test_propose_action_collects_votes(swarm_config):
+    """Test peer votes are collected and failures count as rejections."""
+    agent = ConcreteSwarmAgent(swarm_config)
+    agent._is_running = True
+
+    approve = {"decision": "approve", "confidence": 0.9, "reasoning": "Looks good"}
+    peers = [ConcreteSwarmAgent(SwarmConfig(role=f"peer_{i}")) for i in range(3)]
+    peers[0].evaluate_proposal = AsyncMock(return_value=approve)
+    peers[1].evaluate_proposal = AsyncMock(return_value=approve)
+    peers[2].evaluate_proposal = AsyncMock(side_effect=Exception("peer down"))
+    agent.swarm_peers = peers
+
+    result = await agent.propose_action("transfer", {"amount": 1})
+    assert any("peer down" in reason for reason in result["reasons"])
+
+    # Peers receive a read-only view of the proposal
+    shared = peers[0].evaluate_proposal.await_args[0][0]
+    with pytest.raises(TypeError):
+        shared["params"]["amount"] = 100
+    assert result["consensus"] is False  # 2/3 approval is below 0.7
+
+
+@pytest.mark.asyncio
+async def test_propose_action_stops_at_quorum():
+    """Test vote collection ends once consensus is guaranteed."""
+    agent = ConcreteSwarmAgent(SwarmConfig(role="market_analyzer", min_confidence=0.6, timeout=5.0))
+    agent._is_running = True
+
+    async def never_votes(proposal):
+        await asyncio.Event().wait()
+
+    approve = {"decision": "approve", "confidence": 0.9, "reasoning": "Looks good"}
+    peers = [ConcreteSwarmAgent(SwarmConfig(role=f"peer_{i}")) for i in range(3)]
+    peers[0].evaluate_proposal = AsyncMock(return_value=approve)
+    peers[1].evaluate_proposal = AsyncMock(return_value=approve)
+    peers[2].evaluate_proposal = never_votes
+    agent.swarm_peers = peers
+
+    result = await asyncio.wait_for(agent.propose_action("transfer", {"amount": 1}), 1.0)
+    assert result["consensus"] is True
+    assert result["total_votes"] == 2
+    assert result["early_abort"] is False
+    # Proposal ids are content digests, so peers in other processes agree
+    assert result["proposal_id"] == _proposal_digest(
+        {"type": "transfer", "params": {"amount": 1}, "proposer": "market_analyzer"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_propose_action_aborts_when_consensus_unreachable():
+    """Test vote collection ends once consensus can no longer be reached."""
+    agent = ConcreteSwarmAgent(SwarmConfig(role="market_analyzer", min_votes=2, timeout=5.0))
+    agent._is_running = True
+
+    async def never_votes(proposal):
+        await asyncio.Event().wait()
+
+    reject = {"decision": "reject", "confidence": 0.9, "reasoning": "Too risky"}
+    peers = [ConcreteSwarmAgent(SwarmConfig(role=f"peer_{i}")) for i in range(3)]
+    peers[0].evaluate_proposal = AsyncMock(return_value=reject)
+    peers[1].evaluate_proposal = AsyncMock(return_value=reject)
+    peers[2].evaluate_proposal = never_votes
+    agent.swarm_peers = peers
+
+    result = await asyncio.wait_for(agent.propose_action("transfer", {"amount": 1}), 1.0)
+    assert result["consensus"] is False
+    assert result["early_abort"] is True
+    assert result["total_votes"] < 3
+
+
+@pytest.mark.asyncio
+async def test_evaluate_reuses_cached_llm_result(swarm_config):
+    """Test identical proposals are evaluated by the LLM only once."""
+    from near_swarm.core.llm_provider import LLMConfig
+
+    SwarmAgent._llm_cache.clear()
+    # Only deterministic votes are cached unless caching is requested explicitly
+    swarm_config = dataclasses.replace(
+        swarm_config,
+        llm=LLMConfig(provider="hyperbolic", api_key="test_key", temperature=0.0)
+    )
+    agent = ConcreteSwarmAgent(swarm_config)
+    agent._initialized = True
+    agent.llm = Mock()
+    agent.llm.query = AsyncMock(
+        return_value='{"decision": "approve", "confidence": 0.9, "reasoning": "Looks good"}'
+    )
+
+    context = {"proposal": {"type": "transfer", "params": {"amount": 1}}, "role_prompt": ""}
+    first = await agent.evaluate(context)
+    second = await agent.evaluate(context)
+
+    assert first == second
+    assert agent.llm.query.await_count == 1
+    assert agent.llm.query.await_args.kwargs["expect_json"] is True
+    assert agent.llm.query.await_args.kwargs["response_schema"]["required"] == [
+        "decision", "confidence", "reasoning"
+    ]
+
+    # Another agent with the same role reuses the result
+    other = ConcreteSwarmAgent(swarm_config)
+    other._initialized = True
+    other.llm = agent.llm
+    assert await other.evaluate(context) == first
+    assert agent.llm.query.await_count == 1
+    assert SwarmAgent._llm_cache.stats == {"hits": 2, "misses": 1}
+
+    # Sampled votes are queried every time
+    sampled = ConcreteSwarmAgent(dataclasses.replace(
+        swarm_config,
+        llm=LLMConfig(provider="hyperbolic", api_key="test_key", temperature=0.7)
+    ))
+    sampled._initialized = True
+    sampled.llm = agent.llm
+    await sampled.evaluate(context)
+    await sampled.evaluate(context)
+    assert agent.llm.query.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_evaluations_share_one_query(swarm_config):
+    """Test concurrent evaluations of one proposal wait on a single LLM call."""
+    SwarmAgent._llm_cache.clear()
+    agent = ConcreteSwarmAgent(swarm_config)
+    agent._initialized = True
+
+    async def slow_query(prompt, **kwargs):
+        await asyncio.sleep(0.01)
+        return {"decision": "approve", "confidence": 0.9, "reasoning": "Looks good"}
+
+    agent.llm = Mock()
+    agent.llm.query = AsyncMock(side_effect=slow_query)
+
+    context = {"proposal": {"type": "transfer", "params": {"amount": 2}}, "role_prompt": ""}
+    results = await asyncio.gather(*(agent.evaluate(context) for _ in range(5)))
+
+    assert all(r == results[0] for r in results)
+    assert agent.llm.query.await_count == 1
+    assert agent._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_peers_sharing_llm_are_batched(swarm_config):
+    """Test peers with a shared provider are evaluated in one query."""
+    SwarmAgent._llm_cache.clear()
+    agent = ConcreteSwarmAgent(dataclasses.replace(swarm_config, batch_roles=True))
+    agent._is_running = True
+
+    shared_llm = Mock()
+    shared_llm.query = AsyncMock(return_value={"evaluations": [
+        {"decision": "approve", "confidence": 0.9, "reasoning": "Low risk"},
+        {"decision": "approve", "confidence": 0.8, "reasoning": "Good timing"}
+    ]})
+    peers = [
+        ConcreteSwarmAgent(SwarmConfig(role=role, cache_enabled=True))
+        for role in ("risk_manager", "market_analyzer")
+    ]
+    for peer in peers:
+        peer.llm = shared_llm
+        peer._initialized = True
+        peer._is_running = True
+    agent.swarm_peers = peers
+
+    result = await agent.propose_action("transfer", {"amount": 1})
+    assert result["consensus"] is True
+    assert sorted(result["reasons"]) == ["Good timing", "Low risk"]
+    assert shared_llm.query.await_count == 1
+
+    # Cached votes are reused; only the remaining peer queries the LLM
+    SwarmAgent._llm_cache.clear()
+    proposal = {"type": "transfer", "params": {"amount": 2}, "proposer": "market_analyzer"}
+    await SwarmAgent._llm_cache.set(
+        peers[0]._cache_key(proposal),
+        {"decision": "approve", "confidence": 0.9, "reasoning": "Cached"}
+    )
+    shared_llm.query = AsyncMock(
+        return_value={"decision": "approve", "confidence": 0.8, "reasoning": "Fresh"}
+    )
+    result = await agent.propose_action("transfer", {"amount": 2})
+    assert sorted(result["reasons"]) == ["Cached", "Fresh"]
+    assert shared_llm.query.await_args.kwargs["response_schema"]["required"] == [
+        "decision", "confidence", "reasoning"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_peers_sharing_llm_are_evaluated_separately_by_default(swarm_config):
+    """Test role batching is opt-in, so shared peers go through evaluate_proposal."""
+    agent = ConcreteSwarmAgent(swarm_config)
+    agent._is_running = True
+
+    shared_llm = Mock()
+    peers = [ConcreteSwarmAgent(SwarmConfig(role=role)) for role in ("risk_manager", "market_analyzer")]
+    for peer in peers:
+        peer.llm = shared_llm
+        peer._is_running = True
+        peer.evaluate_proposal = AsyncMock(
+            return_value={"decision": "approve", "confidence": 0.9, "reasoning": "Looks good"}
+        )
+    agent.swarm_peers = peers
+
+    result = await agent.propose_action("transfer", {"amount": 1})
+    assert result["consensus"] is True
+    assert all(peer.evaluate_proposal.await_count == 1 for peer in peers)
+
+
+def test_parse_response_fast_and_full_paths(swarm_config):
+    """Test canonical and non-canonical responses parse the same way."""
+    agent = ConcreteSwarmAgent(swarm_config)
+
+    fast = agent._parse_response('{"decision": "approve", "confidence": 0.8, "reasoning": "ok"}')
+    full = agent._parse_response('{"confidence": 0.8, "decision": "approve", "reasoning": "ok"}')
+    assert fast == full
+
+    escaped = agent._parse_response('{"decision": "reject", "confidence": 1, "reasoning": "say \\"no\\""}')
+    assert escaped["reasoning"] == 'say "no"'
+
+    with pytest.raises(ValueError):
+        agent._parse_response('{"decision": "approve", "confidence": 1.5, "reasoning": "ok"}')
+
+
+@pytest.mark.asyncio
+async def test_propose_action_bounds_reasoning():
+    """Test long peer reasoning is truncated in the result."""
+    agent = ConcreteSwarmAgent(SwarmConfig(role="market_analyzer", min_votes=1, max_reasoning_chars=8))
+    agent._is_running = True
+
+    peer = ConcreteSwarmAgent(SwarmConfig(role="risk_manager"))
+    peer.evaluate_proposal = AsyncMock(
+        return_value={"decision": "approve", "confidence": 0.9, "reasoning": "x" * 100}
+    )
+    agent.swarm_peers = [peer]
+
+    result = await agent.propose_action("transfer", {"amount": 1})
+    assert result["reasons"] == ["x" * 8]
+
+
+@pytest.mark.asyncio
+async def test_propose_action_times_out_slow_peers():
+    """Test peers that miss the deadline are counted as rejections."""
+    agent = ConcreteSwarmAgent(SwarmConfig(role="market_analyzer", min_votes=1, timeout=0.1))
+    agent._is_running = True
+
+    async def never_votes(proposal):
+        await asyncio.Event().wait()
+
+    peers = [ConcreteSwarmAgent(SwarmConfig(role=f"peer_{i}")) for i in range(2)]
+    peers[0].evaluate_proposal = AsyncMock(
+        return_value={"decision": "approve", "confidence": 0.9, "reasoning": "Looks good"}
+    )
+    peers[1].evaluate_proposal = never_votes
+    agent.swarm_peers = peers
+
+    result = await agent.propose_action("transfer", {"amount": 1})
+    assert result["total_votes"] == 2
+    assert result["approval_rate"] == 0.5
+    assert result["consensus"] is False
+    # Results stay plain, serializable dicts
+    assert "No vote before timeout" in json.dumps(result)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_proposal_returns_plain_dicts(swarm_config):
+    """Test fixed votes are returned as mutable copies."""
+    agent = ConcreteSwarmAgent(swarm_config)
+    vote = await agent.evaluate_proposal({"type": "transfer"})
+    assert type(vote) is dict
+    vote["extra"] = True
+    assert "extra" not in await agent.evaluate_proposal({"type": "transfer"})
+
+
+@pytest.mark.asyncio
+async def test_propose_action_dedupes_identical_peers():
+    """Test peers with the same role and model share one evaluation."""
+    agent = ConcreteSwarmAgent(SwarmConfig(role="market_analyzer", dedupe_identical_peers=True))
+    agent._is_running = True
+
+    approve = {"decision": "approve", "confidence": 0.9, "reasoning": "Looks good"}
+    peers = [ConcreteSwarmAgent(SwarmConfig(role="risk_manager")) for _ in range(3)]
+    for peer in peers:
+        peer.evaluate_proposal = AsyncMock(return_value=approve)
+    agent.swarm_peers = peers
+
+    result = await agent.propose_action("transfer", {"amount": 1})
+    assert result["total_votes"] == 3
+    assert result["consensus"] is True
+    assert sum(peer.evaluate_proposal.await_count for peer in peers) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strict_first", [False, True])
+async def test_propose_action_dedupe_keeps_peers_with_different_rules(strict_first):
+    """Test a same-role peer with stricter rules still casts its own vote."""
+    SwarmAgent._llm_cache.clear()
+    agent = ConcreteSwarmAgent(SwarmConfig(role="market_analyzer", dedupe_identical_peers=True))
+    agent._is_running = True
+
+    shared_llm = Mock()
+    shared_llm.query = AsyncMock(
+        return_value={"decision": "approve", "confidence": 0.9, "reasoning": "Looks good"}
+    )
+    loose = ConcreteSwarmAgent(SwarmConfig(role="risk_manager"))
+    strict = ConcreteSwarmAgent(SwarmConfig(role="risk_manager", max_amount=10))
+    for peer in (loose, strict):
+        peer.llm = shared_llm
+        peer._initialized = True
+        peer._is_running = True
+    agent.swarm_peers = [strict, loose] if strict_first else [loose, strict]
+
+    result = await agent.propose_action("transfer", {"amount": 1000})
+    # The strict peer's rejection counts whichever peer is listed first
+    assert "Amount 1000.0 exceeds limit 10" in result["reasons"]
+    assert result["consensus"] is False
+
+
+@pytest.mark.asyncio
+async def test_evaluate_stops_streaming_after_reasoning_limit():
+    """Test bounded reasoning ends the LLM stream early."""
+    SwarmAgent._llm_cache.clear()
+    agent = ConcreteSwarmAgent(SwarmConfig(role="risk_manager", max_reasoning_chars=10))
+    agent._initialized = True
+    agent._is_running = True
+    closed = asyncio.Event()
+
+    async def endless_stream(prompt, **kwargs):
+        try:
+            yield '{"decision": "approve", "confidence": 0.9, '
+            yield '"reasoning": "Position size is within limits'
+            while True:
+                yield " and more"
+        finally:
+            closed.set()
+
+    agent.llm = Mock()
+    agent.llm.stream = endless_stream
+
+    result = await agent.evaluate({"proposal": {"type": "transfer"}, "role_prompt": ""})
+    assert result == {"decision": "approve", "confidence": 0.9, "reasoning": "Position s"}
+    assert closed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_evaluate_micro_batches_concurrent_proposals():
+    """Test concurrent evaluations inside the batch window share one query."""
+    SwarmAgent._llm_cache.clear()
+    agent = ConcreteSwarmAgent(SwarmConfig(role="risk_manager", batch_window=0.05))
+    agent._initialized = True
+    agent._is_running = True
+    agent.llm = Mock()
+    agent.llm.query = AsyncMock(return_value={"evaluations": [
+        {"decision": "approve", "confidence": 0.9, "reasoning": "Small"},
+        {"decision": "reject", "confidence": 0.9, "reasoning": "Too large"}
+    ]})
+
+    contexts = [
+        {"proposal": {"type": "transfer", "params": {"amount": amount}}, "role_prompt": agent._role_prompt}
+        for amount in (1, 1000)
+    ]
+    try:
+        small, large = await asyncio.gather(*(agent.evaluate(c) for c in contexts))
+    finally:
+        await agent.cleanup()
+
+    assert small["decision"] == "approve"
+    assert large["decision"] == "reject"
+    assert agent.llm.query.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cleanup_settles_pending_batched_evaluations():
+    """Test evaluations waiting on the micro-batcher finish when the agent is cleaned up."""
+    SwarmAgent._llm_cache.clear()
+    agent = ConcreteSwarmAgent(SwarmConfig(role="risk_manager", batch_window=0.05))
+    agent._initialized = True
+    agent._is_running = True
+
+    async def never_answers(prompt, **kwargs):
+        await asyncio.Event().wait()
+
+    agent.llm = Mock()
+    agent.llm.query = AsyncMock(side_effect=never_answers)
+
+    context = {"proposal": {"type": "transfer", "params": {"amount": 3}}, "role_prompt": agent._role_prompt}
+    in_flight = asyncio.ensure_future(agent.evaluate(context))
+    await asyncio.sleep(0.1)  # Batch sent; LLM call hanging
+    queued = asyncio.ensure_future(agent.evaluate({**context, "proposal": {"type": "swap"}}))
+    await asyncio.sleep(0)  # In the next window
+    await agent.cleanup()
+
+    results = await asyncio.wait_for(asyncio.gather(in_flight, queued), 1.0)
+    assert all("error" in result for result in results)
+
+
+@pytest.mark.asyncio
+async def test_agents_share_llm_provider():
+    """Test agents with identical LLM settings reuse one provider."""
+    from near_swarm.core.llm_provider import LLMConfig, close_shared_llm_providers
+
+    llm_config = LLMConfig(provider="hyperbolic", api_key="test_key")
+    agents = [
+        ConcreteSwarmAgent(SwarmConfig(role=role, llm=llm_config))
+        for role in ("risk_manager", "market_analyzer")
+    ]
+    try:
+        for agent in agents:
+            await agent.initialize()
+        assert agents[0].llm is agents[1].llm
+
+        # An explicitly passed provider is kept as is
+        provider = Mock()
+        injected = ConcreteSwarmAgent(SwarmConfig(role="risk_manager", llm=llm_config), llm_provider=provider)
+        await injected.initialize()
+        assert injected.llm is provider
+    finally:
+        await close_shared_llm_providers()
+
+
+@pytest.mark.asyncio
+async def test_evaluate_proposal_cheap_reject():
+    """Test static rules reject proposals without querying the LLM."""
+    agent = ConcreteSwarmAgent(SwarmConfig(
+        role="risk_manager",
+        max_amount=10,
+        allowed_actions=("transfer",)
+    ))
+    agent._initialized = True
+    agent._is_running = True
+    agent.llm = Mock()
+    agent.llm.query = AsyncMock()
+
+    too_large = await agent.evaluate_proposal({"type": "transfer", "params": {"amount": "50"}})
+    wrong_type = await agent.evaluate_proposal({"type": "swap", "params": {"amount": 1}})
+
+    assert too_large["decision"] == "reject"
+    assert wrong_type["decision"] == "reject"
+    agent.llm.query.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_roles", [False, True])
+async def test_cheap_reject_applies_to_peers_sharing_llm(batch_roles):
+    """Test static rules hold when peers share one provider, batched or not."""
+    SwarmAgent._llm_cache.clear()
+    agent = ConcreteSwarmAgent(SwarmConfig(role="market_analyzer", batch_roles=batch_roles))
+    agent._is_running = True
+
+    shared_llm = Mock()
+    shared_llm.query = AsyncMock(return_value={"evaluations": [
+        {"decision": "approve", "confidence": 0.9, "reasoning": "Looks good"}
+    ] * 2})
+    peers = [
+        ConcreteSwarmAgent(SwarmConfig(role=role, max_amount=10, allowed_actions=("transfer",)))
+        for role in ("risk_manager", "strategy_optimizer")
+    ]
+    for peer in peers:
+        peer.llm = shared_llm
+        peer._initialized = True
+        peer._is_running = True
+    agent.swarm_peers = peers
+
+    result = await agent.propose_action("swap", {"amount": 1_000_000})
+    assert result["consensus"] is False
+    assert all(vote["decision"] == "reject" for vote in result["votes"])
+    shared_llm.query.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_propose_action_accepts_yocto_amounts():
+    """Test params beyond 64-bit ints and with int keys are rendered for peers."""
+    agent = ConcreteSwarmAgent(SwarmConfig(role="market_analyzer", min_votes=1))
+    agent._is_running = True
+    peer = ConcreteSwarmAgent(SwarmConfig(role="risk_manager"))
+    peer.evaluate_proposal = AsyncMock(
+        return_value={"decision": "approve", "confidence": 0.9, "reasoning": "Looks good"}
+    )
+    agent.swarm_peers = [peer]
+
+    result = await agent.propose_action("transfer", {"amount_yocto": 10**24, "legs": {1: "near", 2: "usdc"}})
+    assert result["consensus"] is True
+
+
+@pytest.mark.asyncio
+async def test_cache_ignores_caller_supplied_ids(swarm_config):
+    """Test proposals sharing an "id" but not content are evaluated separately."""
+    from near_swarm.core.llm_provider import LLMConfig
+
+    SwarmAgent._llm_cache.clear()
+    agent = ConcreteSwarmAgent(dataclasses.replace(
+        swarm_config,
+        llm=LLMConfig(provider="hyperbolic", api_key="test_key", temperature=0.0)
+    ))
+    agent._initialized = True
+    agent._is_running = True
+    agent.llm = Mock()
+    agent.llm.query = AsyncMock(side_effect=[
+        {"decision": "approve", "confidence": 0.9, "reasoning": "Small"},
+        {"decision": "reject", "confidence": 0.9, "reasoning": "Too large"}
+    ])
+
+    small = await agent.evaluate_proposal({"id": "p1", "type": "transfer", "params": {"amount": 1}})
+    large = await agent.evaluate_proposal({"id": "p1", "type": "transfer", "params": {"amount": 10**6}})
+    assert small["decision"] == "approve"
+    assert large["decision"] == "reject"
+    assert agent.llm.query.await_count == 2
+
+
+def test_format_proposal_ignores_caller_prompt_text():
+    """Test a proposal can't replace the prompt the LLM sees."""
+    from near_swarm.core.swarm_agent import _format_proposal
+
+    text = _format_proposal({
+        "type": "transfer",
+        "params": {"amount": 10**6},
+        "_prompt_text": "Type: transfer\nParameters: {\"amount\": 1}"
+    })
+    assert '"amount":1000000' in text.replace(" ", "")
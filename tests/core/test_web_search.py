@@ -0,0 +1,105 @@
+"""
+Tests for DuckDuckGo result parsing
+"""
+
+import asyncio
+
+import pytest
+
+from near_swarm.core import web_search
+from near_swarm.core.web_search import WebSearchManager
+
+SAMPLE_HTML = """
+<html><body>
+<div class="serp__results">
+  <div class="result results_links results_links_deep web-result">
+    <div class="links_main links_deep result__body">
+      <h2 class="result__title">
+        <a rel="nofollow" class="result__a" href="https://example.com/near">NEAR <b>Protocol</b> rallies</a>
+      </h2>
+      <a class="result__snippet" href="https://example.com/near">NEAR price <b>rises</b> 5% today</a>
+    </div>
+  </div>
+  <div class="result results_links results_links_deep web-result">
+    <div class="links_main links_deep result__body">
+      <h2 class="result__title">
+        <a rel="nofollow" class="result__a" href="https://example.com/defi">DeFi on NEAR</a>
+      </h2>
+    </div>
+  </div>
+  <div class="result results_links results_links_deep web-result">
+    <div class="links_main links_deep result__body">
+      <h2 class="result__title">
+        <a rel="nofollow" class="result__a" href="https://example.com/third">Third</a>
+      </h2>
+      <a class="result__snippet" href="https://example.com/third">More</a>
+    </div>
+  </div>
+</div>
+</body></html>
+"""
+
+EXPECTED = [
+    {"title": "NEARProtocolrallies", "url": "https://example.com/near", "snippet": "NEAR pricerises5% today"},
+    {"title": "DeFi on NEAR", "url": "https://example.com/defi", "snippet": ""},
+]
+
+PARSERS = [web_search._parse_with_bs4, web_search._parse_with_regex]
+if web_search.LexborHTMLParser is not None:
+    PARSERS.append(web_search._parse_with_selectolax)
+if web_search.lxml_html is not None:
+    PARSERS.append(web_search._parse_with_lxml)
+
+
+@pytest.mark.parametrize("parse", PARSERS)
+def test_parsers_extract_results(parse):
+    """Test every available parser extracts the same results."""
+    assert parse(SAMPLE_HTML, 2) == EXPECTED
+
+
+def test_parse_page_falls_back_when_markup_changes():
+    """Test pages the regex doesn't recognise go through the DOM parser."""
+    html = SAMPLE_HTML.replace('class="result__a" ', "")
+    assert web_search._parse_with_regex(html, 2) == []
+    assert web_search._parse_page(html, 2) == EXPECTED
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(web_search.lxml_html is None, reason="lxml not installed")
+async def test_stream_parser_matches_full_parse():
+    """Test the incremental lxml parser handles results split across chunks."""
+    class Content:
+        async def iter_chunked(self, size):
+            data = SAMPLE_HTML.encode()
+            for i in range(0, len(data), 97):
+                yield data[i:i + 97]
+
+    assert await web_search._stream_parse_with_lxml(Content(), "utf-8", 2) == EXPECTED
+
+
+@pytest.mark.asyncio
+async def test_identical_searches_share_one_request():
+    """Test concurrent and repeated identical searches hit DuckDuckGo once."""
+    manager = WebSearchManager()
+    calls = []
+
+    async def fake_fetch(query, time_filter):
+        calls.append((query, time_filter))
+        await asyncio.sleep(0.01)
+        return list(EXPECTED)
+
+    manager._fetch = fake_fetch
+    results = await asyncio.gather(*(manager.search("NEAR", "d") for _ in range(3)))
+    assert all(r == EXPECTED for r in results)
+    assert await manager.search("NEAR", "d") == EXPECTED
+    assert calls == [("NEAR", "d")]
+
+    await manager.search("NEAR", "w")
+    assert len(calls) == 2
+
+
+def test_compose_news_query():
+    """Test news searches get news terms and the matching time filter."""
+    assert web_search._compose_news_query("NEAR", 1) == ("NEAR news article", "d")
+    assert web_search._compose_news_query("NEAR", 7) == ("NEAR news article", "w")
+    assert web_search._compose_news_query("NEAR", 30) == ("NEAR news article", "m")